@@ -1,39 +1,65 @@
 """Project-wide site customization for Lily Books."""
 
+import os
 import sys
 import types
-from pathlib import Path
+
+# The stub layout is fixed at checkout time, so build the paths once with
+# plain string ops instead of resolving/stat-ing them on every startup.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_STUB_DIR = os.path.join(_HERE, "packaging_stubs")
+_STUB_PACKAGE_DIR = os.path.join(_STUB_DIR, "packaging")
+
+# Set to sys.prefix once an interpreter has found a real packaging.licenses.
+# Child processes (uvicorn --reload, test workers) running the same
+# environment inherit it and skip the import probe entirely. A stubbed
+# parent does not set it: sys.modules is per-process, so children still
+# need to install their own stub.
+_NATIVE_ENV_VAR = "LILY_BOOKS_NATIVE_PACKAGING_LICENSES"
 
 
 def _ensure_packaging_licenses_stub() -> None:
     """Install a stub for packaging.licenses when using older packaging releases."""
+    if os.environ.get(_NATIVE_ENV_VAR) == sys.prefix:
+        return
+
+    modules = sys.modules
+    if "packaging.licenses" in modules:
+        return
+
+    try:
+        import packaging.licenses  # noqa: F401
+
+        # Modern packaging ships licenses; nothing to stub.
+        os.environ[_NATIVE_ENV_VAR] = sys.prefix
+        return
+    except ImportError:
+        pass
+
     try:
         import packaging  # noqa: F401
     except Exception:
         return
 
-    stub_dir = Path(__file__).resolve().parent / "packaging_stubs"
-    if str(stub_dir) not in sys.path:
-        sys.path.insert(0, str(stub_dir))
-
-    module = sys.modules.get("packaging.licenses")
-    if module is None:
-        module = types.ModuleType("packaging.licenses")
+    if _STUB_DIR not in sys.path:
+        sys.path.insert(0, _STUB_DIR)
 
-        def _normalize(license_str: str | None) -> str | None:
-            return license_str
+    module = types.ModuleType("packaging.licenses")
 
-        module.normalize = _normalize  # type: ignore[attr-defined]
-        module.is_valid = lambda *_args, **_kwargs: True  # type: ignore[attr-defined]
+    def _normalize(license_str: str | None) -> str | None:
+        return license_str
 
-        sys.modules["packaging.licenses"] = module
+    module.normalize = _normalize  # type: ignore[attr-defined]
+    module.is_valid = lambda *_args, **_kwargs: True  # type: ignore[attr-defined]
 
+    modules["packaging.licenses"] = module
     packaging.licenses = module  # type: ignore[attr-defined]
-    stub_package_dir = stub_dir / "packaging"
-    if stub_package_dir.is_dir():
-        package_paths = getattr(packaging, "__path__", [])
-        if str(stub_package_dir) not in package_paths:
-            package_paths.append(str(stub_package_dir))
+
+    # Extending __path__ with a missing directory is harmless, so skip the
+    # is_dir() stat and just keep the append idempotent.
+    package_paths = getattr(packaging, "__path__", [])
+    if _STUB_PACKAGE_DIR not in package_paths:
+        package_paths.append(_STUB_PACKAGE_DIR)
 
 
 _ensure_packaging_licenses_stub()
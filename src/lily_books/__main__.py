@@ -3,14 +3,14 @@
 
 import typer
 
-from .api.main import app
-from .runner import get_pipeline_status, run_pipeline
-from .utils.ssl_fix import fix_ssl_certificates
+cli = typer.Typer()
 
-# Fix SSL certificates on startup
-fix_ssl_certificates()
 
-cli = typer.Typer()
+def _fix_ssl() -> None:
+    """Apply the SSL certificate fix for commands that hit the network."""
+    from .utils.ssl_fix import fix_ssl_certificates
+
+    fix_ssl_certificates()
 
 
 @cli.command()
@@ -23,9 +23,11 @@ def run(
     ),
 ):
     """Run the complete book modernization pipeline."""
-    chapter_list = None
-    if chapters:
-        chapter_list = [int(x.strip()) for x in chapters.split(",")]
+    _fix_ssl()
+    from .runner import run_pipeline
+
+    # int() tolerates surrounding whitespace, so no strip() pass is needed
+    chapter_list = list(map(int, chapters.split(","))) if chapters else None
 
     result = run_pipeline(slug, book_id, chapter_list)
 
@@ -48,6 +50,8 @@ def run(
 @cli.command()
 def status(slug: str = typer.Argument(..., help="Project slug identifier")):
     """Get pipeline status and progress."""
+    from .runner import get_pipeline_status
+
     status_info = get_pipeline_status(slug)
 
     if status_info["status"] == "not_found":
@@ -71,13 +75,16 @@ def api(
     reload: bool = typer.Option(False, "--reload", "-r", help="Enable auto-reload"),
 ):
     """Start the FastAPI server."""
+    _fix_ssl()
     import uvicorn
 
     typer.echo("🚀 Starting Lily Books API server")
     typer.echo(f"🌐 http://{host}:{port}")
     typer.echo(f"📚 Docs: http://{host}:{port}/docs")
 
-    uvicorn.run(app, host=host, port=port, reload=reload)
+    # Pass the import string so the CLI process never builds the app itself
+    # (and so --reload works, which uvicorn only supports for import strings)
+    uvicorn.run("lily_books.api.main:app", host=host, port=port, reload=reload)
 
 
 if __name__ == "__main__":
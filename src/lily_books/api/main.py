@@ -1,20 +1,31 @@
 """FastAPI application for book modernization pipeline."""
 
+import asyncio
+import functools
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from ..config import ensure_directories
 from ..models import ParaPair
-from ..storage import (
-    append_log_entry,
-    load_chapter_doc,
-    load_state,
-    save_chapter_doc,
-    save_state,
-)
+
+# Config and storage are imported inside the handlers: importing them
+# instantiates Settings and the storage layer, which the CLI and app import
+# paths should not pay for until a request actually needs them.
+
+
+@functools.lru_cache(maxsize=1)
+def _settings() -> Any:
+    """Import the settings on first use and reuse them on later requests."""
+    from ..config import settings
+
+    return settings
 
 
 # Request/Response models
@@ -54,47 +65,209 @@ class HealthResponse(BaseModel):
     models_available: bool
 
 
+# Immutable defaults for a new project's state; mutable containers are
+# created fresh per project in create_project to avoid aliasing.
+_INITIAL_STATE_TEMPLATE: dict[str, Any] = {
+    "chapters": None,
+    "rewritten": None,
+    "qa_text_ok": None,
+    "audio_ok": None,
+}
+
+# (feature predicate, required key) pairs checked by the health endpoint
+_HEALTH_KEYS: tuple[tuple[Any, str], ...] = (
+    (lambda s: True, "openrouter_api_key"),
+    (lambda s: s.enable_audio, "fish_api_key"),
+    (lambda s: True, "ideogram_api_key"),
+    (lambda s: s.langfuse_enabled, "langfuse_public_key"),
+    (lambda s: s.langfuse_enabled, "langfuse_secret_key"),
+)
+
+# Short-lived caches for state/chapter reads so HITL UI polling doesn't
+# re-read and re-parse the same JSON on every request. Entries hold
+# (checked_at, file_version, value); once the TTL lapses an entry is
+# revalidated with a single stat and only re-parsed if the file changed.
+# Writes made through this API invalidate the affected entries. Both caches
+# are LRU-bounded so a long-running server doesn't keep every chapter of
+# every book it has served. Handlers touch the caches on the event loop
+# thread; _CACHE_LOCK keeps each LRU update atomic regardless.
+_CACHE_TTL_SECONDS = 5.0
+_STATE_CACHE_MAX_ENTRIES = 64
+_CHAPTER_CACHE_MAX_ENTRIES = 512
+_STATE_CACHE: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+_CHAPTER_CACHE: OrderedDict[tuple[str, int], tuple[float, int, Any]] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    """Look up a cache entry, marking it most recently used."""
+    with _CACHE_LOCK:
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+        return entry
+
+
+def _cache_put(cache: OrderedDict, key: Any, entry: Any, max_entries: int) -> None:
+    """Store a cache entry, evicting the least recently used beyond the bound."""
+    with _CACHE_LOCK:
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+
+
+def _cache_drop(cache: OrderedDict, key: Any) -> None:
+    """Remove a cache entry if present."""
+    with _CACHE_LOCK:
+        cache.pop(key, None)
+
+
+def _cached_state(slug: str) -> tuple[int | None, Any]:
+    """Return (file_version, state), reusing a cached copy when still valid."""
+    from ..storage import get_state_version, load_state
+
+    cached = _cache_get(_STATE_CACHE, slug)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _CACHE_TTL_SECONDS:
+        return cached[1], cached[2]
+
+    version = get_state_version(slug)
+    if version is None:
+        _cache_drop(_STATE_CACHE, slug)
+        return None, None
+    if cached is not None and cached[1] == version:
+        _cache_put(
+            _STATE_CACHE, slug, (now, version, cached[2]), _STATE_CACHE_MAX_ENTRIES
+        )
+        return version, cached[2]
+
+    state = load_state(slug)
+    if state:
+        _cache_put(_STATE_CACHE, slug, (now, version, state), _STATE_CACHE_MAX_ENTRIES)
+    else:
+        _cache_drop(_STATE_CACHE, slug)
+    return version, state
+
+
+async def _cached_chapter(slug: str, chapter_num: int) -> tuple[int | None, Any]:
+    """Return (file_version, ChapterDoc), reusing a cached copy when still valid.
+
+    Only the stat and the file load run in worker threads; the cache itself
+    is read and updated on the event loop.
+    """
+    from ..storage import get_chapter_doc_version, load_chapter_doc
+
+    key = (slug, chapter_num)
+    cached = _cache_get(_CHAPTER_CACHE, key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _CACHE_TTL_SECONDS:
+        return cached[1], cached[2]
+
+    version = await asyncio.to_thread(get_chapter_doc_version, slug, chapter_num)
+    if version is None:
+        _cache_drop(_CHAPTER_CACHE, key)
+        return None, None
+    if cached is not None and cached[1] == version:
+        _cache_put(
+            _CHAPTER_CACHE, key, (now, version, cached[2]), _CHAPTER_CACHE_MAX_ENTRIES
+        )
+        return version, cached[2]
+
+    chapter_doc = await asyncio.to_thread(load_chapter_doc, slug, chapter_num)
+    if chapter_doc:
+        _cache_put(
+            _CHAPTER_CACHE, key, (now, version, chapter_doc), _CHAPTER_CACHE_MAX_ENTRIES
+        )
+    else:
+        _cache_drop(_CHAPTER_CACHE, key)
+    return version, chapter_doc
+
+
+# Per-chapter locks serializing HITL edits (see update_pair). Weak values:
+# a lock is kept only while an edit holds or awaits it, then dropped.
+_EDIT_LOCKS: weakref.WeakValueDictionary[tuple[str, int], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _etag(version: int) -> str:
+    """Build a weak ETag from a file version."""
+    return f'W/"{version:x}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already covers this ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in header.split(","))
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Lily Books API",
     description="LangChain/LangGraph pipeline for public-domain book modernization",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
+
+class _SettingsCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that reads its allowed origins from settings.
+
+    Starlette builds the middleware stack on the first request, so reading
+    the config here keeps importing the app from instantiating Settings.
+    """
+
+    def __init__(self, app: Any, **kwargs: Any) -> None:
+        from ..config import get_config
+
+        super().__init__(app, allow_origins=tuple(get_config().cors_origins), **kwargs)
+
+
+# Add CORS middleware with explicit method/header allow-lists so preflight
+# checks are simple membership tests. With credentials allowed, Starlette
+# echoes the request origin for credentialed requests even when origins are
+# "*", as it did with the original wildcard configuration.
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    _SettingsCORSMiddleware,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PATCH"),
+    allow_headers=("content-type", "authorization", "if-none-match"),
+    # Cross-origin JS can only read the ETag to send it back if it's exposed
+    expose_headers=("ETag",),
 )
 
 
 @app.post("/api/projects", response_model=ProjectCreateResponse)
 async def create_project(request: ProjectCreateRequest) -> ProjectCreateResponse:
     """Create a new project."""
+    from ..config import ensure_directories
+    from ..storage import append_log_entry, save_state
+
     try:
         # Ensure directories exist
-        ensure_directories(request.slug)
+        await asyncio.to_thread(ensure_directories, request.slug)
 
         # Initialize state
         initial_state = {
+            **_INITIAL_STATE_TEMPLATE,
             "slug": request.slug,
             "book_id": request.book_id,
             "paths": {},
-            "chapters": None,
-            "rewritten": None,
-            "qa_text_ok": None,
-            "audio_ok": None,
             "errors": [],
         }
 
         # Save initial state
-        save_state(request.slug, initial_state)
+        await asyncio.to_thread(save_state, request.slug, initial_state)
+        _cache_drop(_STATE_CACHE, request.slug)
 
         # Log project creation
-        append_log_entry(
+        await asyncio.to_thread(
+            append_log_entry,
             request.slug,
             {
                 "action": "project_created",
@@ -115,33 +288,45 @@ async def create_project(request: ProjectCreateRequest) -> ProjectCreateResponse
 
 
 @app.get("/api/projects/{slug}/status")
-async def get_project_status(slug: str) -> dict[str, Any]:
+async def get_project_status(slug: str, request: Request) -> Response:
     """Get project status and state."""
-    state = load_state(slug)
+    version, state = _cached_state(slug)
     if not state:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Project {slug} not found"
         )
 
-    return state
+    etag = _etag(version)
+    if _etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    return ORJSONResponse(state, headers={"ETag": etag})
 
 
 @app.get(
     "/api/projects/{slug}/chapters/{chapter_num}/pairs",
     response_model=ChapterPairsResponse,
 )
-async def get_chapter_pairs(slug: str, chapter_num: int) -> ChapterPairsResponse:
+async def get_chapter_pairs(slug: str, chapter_num: int, request: Request) -> Response:
     """Get paragraph pairs for a specific chapter."""
-    chapter_doc = load_chapter_doc(slug, chapter_num)
+    version, chapter_doc = await _cached_chapter(slug, chapter_num)
     if not chapter_doc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Chapter {chapter_num} not found for project {slug}",
         )
 
-    return ChapterPairsResponse(
-        chapter=chapter_doc.chapter, title=chapter_doc.title, pairs=chapter_doc.pairs
-    )
+    etag = _etag(version)
+    if _etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    # ChapterDoc has exactly the ChapterPairsResponse shape and was validated
+    # when loaded, so dump it directly instead of re-validating every pair.
+    return ORJSONResponse(chapter_doc.model_dump(mode="json"), headers={"ETag": etag})
 
 
 @app.patch("/api/projects/{slug}/chapters/{chapter_num}/pairs/{pair_index}")
@@ -149,29 +334,36 @@ async def update_pair(
     slug: str, chapter_num: int, pair_index: int, request: PairUpdateRequest
 ) -> dict[str, str]:
     """Update modern text for a specific paragraph pair (HITL edit)."""
-    chapter_doc = load_chapter_doc(slug, chapter_num)
-    if not chapter_doc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Chapter {chapter_num} not found for project {slug}",
-        )
-
-    if pair_index >= len(chapter_doc.pairs):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Pair index {pair_index} out of range",
-        )
-
-    # Update the pair
-    chapter_doc.pairs[pair_index].modern = request.modern
-    if request.notes:
-        chapter_doc.pairs[pair_index].notes = request.notes
-
-    # Save updated chapter
-    save_chapter_doc(slug, chapter_num, chapter_doc)
+    from ..storage import append_log_entry, load_chapter_doc, save_chapter_doc
+
+    # File I/O runs off the event loop, so serialize edits to the same chapter
+    # to keep the read-modify-write from losing concurrent updates
+    async with _EDIT_LOCKS.setdefault((slug, chapter_num), asyncio.Lock()):
+        chapter_doc = await asyncio.to_thread(load_chapter_doc, slug, chapter_num)
+        if not chapter_doc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Chapter {chapter_num} not found for project {slug}",
+            )
+
+        if pair_index >= len(chapter_doc.pairs):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Pair index {pair_index} out of range",
+            )
+
+        # Update the pair
+        chapter_doc.pairs[pair_index].modern = request.modern
+        if request.notes:
+            chapter_doc.pairs[pair_index].notes = request.notes
+
+        # Save updated chapter
+        await asyncio.to_thread(save_chapter_doc, slug, chapter_num, chapter_doc)
+        _cache_drop(_CHAPTER_CACHE, (slug, chapter_num))
 
     # Log the edit
-    append_log_entry(
+    await asyncio.to_thread(
+        append_log_entry,
         slug,
         {
             "action": "pair_updated",
@@ -187,9 +379,13 @@ async def update_pair(
 @app.post("/api/projects/{slug}/chapters/{chapter_num}/retry")
 async def retry_chapter(slug: str, chapter_num: int) -> dict[str, str]:
     """Trigger remediation for a specific chapter."""
+    from ..storage import append_log_entry
+
     # TODO: Implement remediation logic
-    append_log_entry(
-        slug, {"action": "chapter_retry_requested", "chapter": chapter_num}
+    await asyncio.to_thread(
+        append_log_entry,
+        slug,
+        {"action": "chapter_retry_requested", "chapter": chapter_num},
     )
 
     return {"status": "retry_requested"}
@@ -198,7 +394,7 @@ async def retry_chapter(slug: str, chapter_num: int) -> dict[str, str]:
 @app.get("/api/projects/{slug}/qa/summary", response_model=QASummaryResponse)
 async def get_qa_summary(slug: str) -> QASummaryResponse:
     """Get aggregated QA metrics across all chapters."""
-    state = load_state(slug)
+    _, state = _cached_state(slug)
     if not state:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Project {slug} not found"
@@ -213,31 +409,45 @@ async def get_qa_summary(slug: str) -> QASummaryResponse:
             readability_grades=[],
         )
 
-    total_chapters = len(state["rewritten"])
+    rewritten = state["rewritten"]
+    total_chapters = len(rewritten)
     passed_chapters = 0
     total_issues = 0
     fidelity_scores = []
     readability_grades = []
 
-    for chapter_doc in state["rewritten"]:
-        chapter_num = chapter_doc.chapter
-        chapter_doc = load_chapter_doc(slug, chapter_num)
+    # State loaded from disk holds plain dicts; in-process state holds ChapterDocs
+    chapter_nums = [
+        entry["chapter"] if isinstance(entry, dict) else entry.chapter
+        for entry in rewritten
+    ]
+
+    # Load all chapter files concurrently instead of one blocking read per loop
+    cached_chapters = await asyncio.gather(
+        *[_cached_chapter(slug, chapter_num) for chapter_num in chapter_nums]
+    )
+
+    append_fidelity = fidelity_scores.append
+    append_grade = readability_grades.append
+    for _, chapter_doc in cached_chapters:
+        if not chapter_doc or not chapter_doc.pairs:
+            continue
 
-        if chapter_doc and chapter_doc.pairs:
-            chapter_passed = True
-            for pair in chapter_doc.pairs:
-                if pair.qa:
-                    fidelity_scores.append(pair.qa.fidelity_score)
-                    readability_grades.append(pair.qa.readability_grade)
-                    total_issues += len(pair.qa.issues)
+        chapter_passed = True
+        for pair in chapter_doc.pairs:
+            qa = pair.qa
+            if qa is None:
+                continue
 
-                    if not (
-                        pair.qa.modernization_complete and pair.qa.formatting_preserved
-                    ):
-                        chapter_passed = False
+            append_fidelity(qa.fidelity_score)
+            append_grade(qa.readability_grade)
+            total_issues += len(qa.issues)
 
-            if chapter_passed:
-                passed_chapters += 1
+            if not (qa.modernization_complete and qa.formatting_preserved):
+                chapter_passed = False
+
+        if chapter_passed:
+            passed_chapters += 1
 
     return QASummaryResponse(
         total_chapters=total_chapters,
@@ -251,20 +461,12 @@ async def get_qa_summary(slug: str) -> QASummaryResponse:
 @app.get("/api/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """Check API health and configuration."""
-    from ..config import settings
+    settings = _settings()
 
     # Check API keys (respect optional features)
-    api_keys_ok = bool(settings.openrouter_api_key)
-
-    if settings.enable_audio:
-        api_keys_ok = api_keys_ok and bool(settings.fish_api_key)
-
-    api_keys_ok = api_keys_ok and bool(settings.ideogram_api_key)
-
-    if settings.langfuse_enabled:
-        api_keys_ok = api_keys_ok and bool(
-            settings.langfuse_public_key and settings.langfuse_secret_key
-        )
+    api_keys_ok = all(
+        getattr(settings, key) for enabled, key in _HEALTH_KEYS if enabled(settings)
+    )
 
     # TODO: Add model connectivity checks
     models_ok = True
@@ -1,8 +1,17 @@
 """Checker chain for QA validation using Claude Sonnet."""
 
 import asyncio
+import atexit
+import functools
+import hashlib
+import inspect
 import logging
 import re
+import unicodedata
+import weakref
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 logger = logging.getLogger(__name__)
 # Ensure legacy module path works for older tests (src.lily_books...)
@@ -10,14 +19,17 @@ import sys as _sys
 from collections.abc import Callable
 from typing import Any
 
+import orjson
 import textstat
+from langchain_core.messages import SystemMessage
 from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompts import ChatPromptTemplate
 from pydantic import ValidationError
 
 from .. import observability
 from ..config import settings
 from ..models import ChapterDoc, CheckerOutput, ParaPair, QAIssue, QAReport
-from ..utils import llm_factory
+from ..utils import fail_fast, llm_factory
 from ..utils.validators import (
     log_llm_decision,
     safe_parse_checker_output,
@@ -37,6 +49,106 @@ logger = logging.getLogger(__name__)
 checker_chain = None
 
 
+def pair_content_key(orig: str, modern: str) -> bytes:
+    """Return the 16-byte content key for a paragraph pair.
+
+    Shared by in-chapter deduplication and the result cache so each pair is
+    encoded and hashed once per QA pass.
+    """
+    return hashlib.blake2b(f"{orig}\x1f{modern}".encode(), digest_size=16).digest()
+
+
+class CheckerResultCache:
+    """Bounded exact-match cache of CheckerOutput keyed on (orig, modern).
+
+    The checker runs at temperature 0, so an identical pair yields the same
+    verdict; re-runs and retries can skip the LLM round-trip entirely.
+    Entries are scoped to the checker model and prompt version, so switching
+    either never serves a verdict produced under the old configuration.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, bytes], str] = OrderedDict()
+
+    @staticmethod
+    def get_cache_key(orig: str, modern: str) -> bytes:
+        """Generate cache key for a paragraph pair."""
+        return pair_content_key(orig, modern)
+
+    @staticmethod
+    def _scope() -> str:
+        """Return the model/prompt scope the current verdicts belong to."""
+        return f"{settings.anthropic_model}:{CHECKER_PROMPT_VERSION}"
+
+    def get(
+        self, orig: str, modern: str, key: bytes | None = None
+    ) -> CheckerOutput | None:
+        """Return the cached result for a pair, if any."""
+        key = (self._scope(), key or self.get_cache_key(orig, modern))
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        self._entries.move_to_end(key)
+        return CheckerOutput.model_validate_json(cached)
+
+    def put(
+        self, orig: str, modern: str, result: CheckerOutput, key: bytes | None = None
+    ) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        key = (self._scope(), key or self.get_cache_key(orig, modern))
+        self._entries[key] = result.model_dump_json()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached results."""
+        self._entries.clear()
+
+
+# Global cache instance
+checker_result_cache = CheckerResultCache()
+
+# One semaphore per event loop bounds concurrent checker calls process-wide
+# (asyncio primitives cannot be shared across loops).
+_QA_SEMAPHORES: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_qa_semaphore() -> asyncio.Semaphore:
+    """Return the checker concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _QA_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, settings.qa_max_concurrency))
+        _QA_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
+# Dedicated pool for chains without native async (e.g. patched sync chains),
+# sized to the QA concurrency instead of sharing the loop's default executor.
+_QA_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(1, settings.qa_max_concurrency), thread_name_prefix="qa"
+)
+atexit.register(_QA_EXECUTOR.shutdown, wait=False)
+
+
+async def _ainvoke_checker(checker_chain, input_data: dict, config: dict):
+    """Invoke the checker chain, natively async when the chain supports it."""
+    if inspect.iscoroutinefunction(getattr(checker_chain, "ainvoke", None)):
+        return await checker_chain.ainvoke(input_data, config=config)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _QA_EXECUTOR, functools.partial(checker_chain.invoke, input_data, config=config)
+    )
+
+
+_MD_JSON_BLOCK_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.S)
+_MD_BLOCK_RE = re.compile(r"```(.*?)(?:```|\Z)", re.S)
+_BRACE_RE = re.compile(r"[{}]")
+
+
 def strip_markdown_code_blocks(text: str) -> str:
     """Remove markdown code blocks and extract JSON from LLM output.
 
@@ -45,10 +157,9 @@ def strip_markdown_code_blocks(text: str) -> str:
     """
     # Remove markdown code blocks if present
     cleaned = text
-    if "```json" in cleaned:
-        cleaned = cleaned.split("```json")[1].split("```")[0].strip()
-    elif "```" in cleaned:
-        cleaned = cleaned.split("```")[1].split("```")[0].strip()
+    match = _MD_JSON_BLOCK_RE.search(cleaned) or _MD_BLOCK_RE.search(cleaned)
+    if match:
+        cleaned = match.group(1).strip()
 
     # Find the JSON object - it starts with { and ends with }
     # This handles cases where LLM adds commentary before or after the JSON
@@ -57,33 +168,120 @@ def strip_markdown_code_blocks(text: str) -> str:
         # No JSON found, return original (will likely fail parsing, but that's expected)
         return text.strip()
 
-    # Find the matching closing brace
+    # Find the matching closing brace, jumping between braces only
     brace_count = 0
     end_idx = start_idx
-    for i in range(start_idx, len(cleaned)):
-        if cleaned[i] == "{":
+    for brace in _BRACE_RE.finditer(cleaned, start_idx):
+        if brace.group() == "{":
             brace_count += 1
-        elif cleaned[i] == "}":
+        else:
             brace_count -= 1
             if brace_count == 0:
-                end_idx = i + 1
+                end_idx = brace.end()
                 break
 
     return cleaned[start_idx:end_idx]
 
 
-def _build_checker_chain(trace_name: str | None = None):
-    """Construct checker chain and expose it globally for compatibility."""
-    global checker_chain
+def _parse_checker_llm_output(llm_response):
+    """Extract JSON from LLM response and parse to CheckerOutput."""
+    # Surface prompt-cache hits on the shared system prefix
+    usage = getattr(llm_response, "usage_metadata", None) or {}
+    cache_read = (usage.get("input_token_details") or {}).get("cache_read")
+    if cache_read is not None:
+        logger.debug(
+            "Checker prompt cache: cache_read_input_tokens=%s, input_tokens=%s",
+            cache_read,
+            usage.get("input_tokens"),
+        )
+
+    # Get the content from the LLM response
+    content = (
+        llm_response.content if hasattr(llm_response, "content") else str(llm_response)
+    )
+    # Strip markdown and extract JSON
+    json_str = strip_markdown_code_blocks(content)
+    # Parse JSON to dict (let safe_parse_checker_output handle CheckerOutput conversion)
+    return orjson.loads(json_str)
+
+
+def _parse_checker_batch_output(llm_response) -> list[dict]:
+    """Parse a batched checker response into one raw result dict per pair."""
+    data = _parse_checker_llm_output(llm_response)
+    results = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(results, list):
+        raise ValueError("Checker batch response has no results array")
+    return results
+
+
+def _format_checker_batch(pairs: list[dict]) -> str:
+    """Render pairs as the numbered blocks CHECKER_BATCH_USER expects."""
+    return "\n\n".join(
+        f"### Pair {n}\n\n**ORIGINAL:**\n{p['orig']}\n\n**MODERNIZED:**\n{p['modern']}"
+        for n, p in enumerate(pairs, 1)
+    )
+
 
-    patched_chain = None
+@functools.lru_cache(maxsize=1)
+def _get_checker_llm(llm_factory: Callable):
+    """Create the checker LLM once per process (per LLM factory).
+
+    Reusing the client keeps its connection pool alive across chapters and is
+    shared by the per-pair and batched chains. Keyed on the factory so
+    patching create_llm_with_fallback yields a fresh client.
+    """
+    return llm_factory(
+        provider="anthropic",
+        temperature=0.0,
+        timeout=30,
+        max_retries=2,
+        cache_enabled=True,
+        trace_name="checker",
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_checker_chain(llm_factory: Callable):
+    """Build the per-pair checker chain once per process (per LLM factory)."""
+    return (
+        {
+            "original": itemgetter("orig"),
+            "modern": itemgetter("modern"),
+        }
+        | checker_prompt
+        | _get_checker_llm(llm_factory)
+        | _parse_checker_llm_output
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_checker_batch_chain(llm_factory: Callable):
+    """Build the batched checker chain once per process (per LLM factory)."""
+    return (
+        {
+            "pairs": lambda d: _format_checker_batch(d["pairs"]),
+            "count": lambda d: len(d["pairs"]),
+        }
+        | checker_batch_prompt
+        | _get_checker_llm(llm_factory)
+        | _parse_checker_batch_output
+    )
+
+
+def _is_patched_chain(chain: Any) -> bool:
+    """Return True if ``chain`` is a test double rather than a built chain."""
     try:
         from unittest.mock import Mock
-
-        if checker_chain is not None and isinstance(checker_chain, Mock):
-            patched_chain = checker_chain
     except Exception:
-        patched_chain = None
+        return False
+    return isinstance(chain, Mock)
+
+
+def _build_checker_chain(trace_name: str | None = None):
+    """Return the shared checker chain and expose it globally for compatibility."""
+    global checker_chain
+
+    patched_chain = checker_chain if _is_patched_chain(checker_chain) else None
 
     if patched_chain is not None:
         logger.debug("_build_checker_chain using patched checker_chain (mock)")
@@ -91,71 +289,86 @@ def _build_checker_chain(trace_name: str | None = None):
         checker_chain = patched_chain
         return patched_chain
 
-    kwargs = {
-        "provider": "anthropic",
-        "temperature": 0.0,
-        "timeout": 30,
-        "max_retries": 2,
-        "cache_enabled": True,
-    }
+    chain = _get_checker_chain(create_llm_with_fallback)
     if trace_name is not None:
-        kwargs["trace_name"] = trace_name
-
-    checker_llm = create_llm_with_fallback(**kwargs)
+        # Per-chapter run name for tracing, without rebuilding the client
+        chain = chain.with_config(run_name=trace_name)
 
-    # Create a function to extract and parse JSON from LLM output
-    def parse_llm_output(llm_response):
-        """Extract JSON from LLM response and parse to CheckerOutput."""
-        import json
+    checker_chain = chain
+    return chain
 
-        # Get the content from the LLM response
-        content = (
-            llm_response.content
-            if hasattr(llm_response, "content")
-            else str(llm_response)
-        )
-        # Strip markdown and extract JSON
-        json_str = strip_markdown_code_blocks(content)
-        # Parse JSON to dict (let safe_parse_checker_output handle CheckerOutput conversion)
-        return json.loads(json_str)
 
-    chain = (
-        {
-            "original": lambda d: d["orig"],
-            "modern": lambda d: d["modern"],
-            "format_instructions": lambda d: checker_parser.get_format_instructions(),
-        }
-        | checker_prompt
-        | checker_llm
-        | parse_llm_output
-    )
+def _build_checker_batch_chain(trace_name: str | None = None):
+    """Return the shared batched checker chain, or None for patched chains."""
+    if _is_patched_chain(checker_chain):
+        return None
 
-    checker_chain = chain
+    chain = _get_checker_batch_chain(create_llm_with_fallback)
+    if trace_name is not None:
+        chain = chain.with_config(run_name=trace_name)
     return chain
 
 
 def evaluate_chapter_quality(
-    pairs: list[ParaPair], issues: list[dict], quality_settings: dict[str, Any]
+    pairs: list[ParaPair],
+    issues: list[dict],
+    quality_settings: dict[str, Any],
+    stats: dict[str, Any] | None = None,
 ) -> tuple[bool, str, list[QAIssue]]:
     """
     Evaluate chapter quality using graduated thresholds.
 
+    If ``stats`` is given it is filled with the ``min_fidelity`` and
+    ``mean_fidelity`` computed along the way (None when nothing was scored).
+
     Returns:
         (passed, failure_reason, critical_qa_issues)
     """
     critical_qa_issues = []
+    min_grade, max_grade = quality_settings["readability_range"]
 
-    # Extract metrics from all pairs
-    fidelity_scores = [
-        p.qa.fidelity_score for p in pairs if p.qa and p.qa.fidelity_score is not None
-    ]
+    # Single pass over the checked pairs gathers everything the gates need
+    min_fidelity = None
+    fidelity_total = 0
+    fidelity_count = 0
+    llm_issues = []
     critical_issues_from_llm = []
-
+    readability_failure = None
+    formatting_flags = []
     for pair in pairs:
-        if not pair.qa:
+        qa = pair.qa
+        if not qa:
             continue
-        critical_issues_from_llm.extend(
-            [i for i in pair.qa.issues if i.severity == "critical"]
+
+        fidelity = qa.fidelity_score
+        if fidelity is not None:
+            fidelity_total += fidelity
+            fidelity_count += 1
+            if min_fidelity is None or fidelity < min_fidelity:
+                min_fidelity = fidelity
+
+        for issue in qa.issues:
+            llm_issues.append(issue)
+            if issue.severity == "critical":
+                critical_issues_from_llm.append(issue)
+
+        grade = qa.readability_grade
+        if (
+            readability_failure is None
+            and grade is not None
+            and not min_grade <= grade <= max_grade
+        ):
+            readability_failure = (pair.i, grade)
+
+        quote_mismatch = qa.quote_count_match is False
+        emphasis_lost = qa.emphasis_preserved is False
+        if quote_mismatch or emphasis_lost:
+            formatting_flags.append((pair.i, quote_mismatch, emphasis_lost))
+
+    if stats is not None:
+        stats["min_fidelity"] = min_fidelity
+        stats["mean_fidelity"] = (
+            fidelity_total / fidelity_count if fidelity_count else None
         )
 
     # CRITICAL CHECK 1: LLM flagged critical issues
@@ -165,59 +378,39 @@ def evaluate_chapter_quality(
         return False, reason, critical_qa_issues
 
     # CRITICAL CHECK 2: Fidelity below minimum threshold
-    if fidelity_scores:
-        min_fidelity = min(fidelity_scores)
-        sum(fidelity_scores) / len(fidelity_scores)
-
-        if min_fidelity < quality_settings["min_fidelity"]:
-            reason = f"Fidelity too low: min={min_fidelity}/100 (threshold: {quality_settings['min_fidelity']})"
-            critical_qa_issues.append(
-                QAIssue(type="fidelity", description=reason, severity="critical")
-            )
-            return False, reason, critical_qa_issues
-
-    # CRITICAL CHECK 3: Readability outside acceptable range
-    min_grade, max_grade = quality_settings["readability_range"]
-    for pair in pairs:
-        if not pair.qa or pair.qa.readability_grade is None:
-            continue
+    if min_fidelity is not None and min_fidelity < quality_settings["min_fidelity"]:
+        reason = f"Fidelity too low: min={min_fidelity}/100 (threshold: {quality_settings['min_fidelity']})"
+        critical_qa_issues.append(
+            QAIssue(type="fidelity", description=reason, severity="critical")
+        )
+        return False, reason, critical_qa_issues
 
-        grade = pair.qa.readability_grade
+    # CRITICAL CHECK 3: Readability outside acceptable range (first offender)
+    if readability_failure is not None:
+        pair_i, grade = readability_failure
         if grade < min_grade:
             reason = f"Text oversimplified: FK grade {grade:.1f} (minimum: {min_grade})"
-            critical_qa_issues.append(
-                QAIssue(
-                    type="readability",
-                    description=f"Paragraph {pair.i}: {reason}",
-                    severity="critical",
-                )
-            )
-            return False, f"Paragraph {pair.i}: {reason}", critical_qa_issues
-
-        if grade > max_grade:
+        else:
             reason = f"Text too complex: FK grade {grade:.1f} (maximum: {max_grade})"
-            critical_qa_issues.append(
-                QAIssue(
-                    type="readability",
-                    description=f"Paragraph {pair.i}: {reason}",
-                    severity="critical",
-                )
+        critical_qa_issues.append(
+            QAIssue(
+                type="readability",
+                description=f"Paragraph {pair_i}: {reason}",
+                severity="critical",
             )
-            return False, f"Paragraph {pair.i}: {reason}", critical_qa_issues
+        )
+        return False, f"Paragraph {pair_i}: {reason}", critical_qa_issues
 
     # HIGH SEVERITY CHECK: Formatting issues
     quote_severity = quality_settings.get("quote_severity", "high")
     emphasis_severity = quality_settings.get("emphasis_severity", "high")
 
-    for pair in pairs:
-        if not pair.qa:
-            continue
-
+    for pair_i, quote_mismatch, emphasis_lost in formatting_flags:
         # Quote preservation
-        if pair.qa.quote_count_match is False:
+        if quote_mismatch:
             issue = QAIssue(
                 type="formatting",
-                description=f"Paragraph {pair.i}: Quote count mismatch - dialogue may be missing",
+                description=f"Paragraph {pair_i}: Quote count mismatch - dialogue may be missing",
                 severity=quote_severity,
             )
             critical_qa_issues.append(issue)
@@ -226,10 +419,10 @@ def evaluate_chapter_quality(
                 return False, "Quote preservation failed", critical_qa_issues
 
         # Emphasis preservation
-        if pair.qa.emphasis_preserved is False:
+        if emphasis_lost:
             issue = QAIssue(
                 type="formatting",
-                description=f"Paragraph {pair.i}: Emphasis markers not preserved",
+                description=f"Paragraph {pair_i}: Emphasis markers not preserved",
                 severity=emphasis_severity,
             )
             critical_qa_issues.append(issue)
@@ -239,15 +432,7 @@ def evaluate_chapter_quality(
 
     # PASSED - Trust LLM for everything else
     # Collect all issues for tracking (including formatting issues that didn't fail)
-    all_issues = []
-    for pair in pairs:
-        if not pair.qa:
-            continue
-        # Add all issues from LLM (critical ones already handled above)
-        all_issues.extend(pair.qa.issues)
-
-    # Add formatting issues that were tracked but didn't cause failure
-    all_issues.extend(critical_qa_issues)
+    all_issues = llm_issues + critical_qa_issues
 
     if all_issues:
         logger.warning(f"Chapter passed with {len(all_issues)} issues tracked")
@@ -258,46 +443,85 @@ def evaluate_chapter_quality(
 # Comprehensive LangChain system prompt for quality assurance
 CHECKER_SYSTEM = """You are a literary editor evaluating text modernization quality.
 
-## Evaluation Criteria
-1. **FIDELITY**: Preserve exact meaning and content
-2. **MODERNIZATION**: Update archaic language appropriately
-3. **FORMATTING**: Convert `_italics_` to `<em>italics</em>`
-4. **READABILITY**: Target grade level 7-9
-
-## Scoring
-- **90-100**: Perfect preservation
-- **80-89**: Excellent with minor changes
-- **70-79**: Good with acceptable changes
-- **60-69**: Adequate with noticeable changes
-- **Below 60**: Significant content loss
-
-### Formatting Validation
-- **Perfect**: All quotes, emphasis, and structure preserved exactly
-- **Minor Issues**: Small formatting inconsistencies that don't affect readability
-- **Major Issues**: Significant formatting problems that impact comprehension
-
-## Common Issues to Flag
-
-### Critical Issues (Must Fail)
-- Missing or changed dialogue
-- Altered character names or relationships
-- Changed plot points or story events
-- Lost emphasis or formatting that affects meaning
-- Inappropriate modernization (adding modern concepts not implied)
-
-### Moderate Issues (Flag but May Pass)
-- Minor readability problems
-- Small formatting inconsistencies
-- Slight tone variations
-- Acceptable cultural adaptations
-
-### Minor Issues (Note but Don't Fail)
-- Style preferences
-- Minor word choice variations
-- Acceptable simplifications
-
-## Output Requirements
-Provide a comprehensive assessment using the structured format specified in the format instructions. Include specific examples of issues found and recommendations for improvement when applicable."""
+## Criteria
+- FIDELITY: meaning, content, dialogue, names and plot events preserved
+- MODERNIZATION: archaic language updated without adding modern concepts
+- FORMATTING: quotes and structure kept; `_italics_` become `<em>italics</em>`
+- READABILITY: target grade level 7-9
+
+## Fidelity score
+90-100 perfect | 80-89 minor changes | 70-79 acceptable changes |
+60-69 noticeable changes | <60 significant content loss
+
+## Issue severity
+- critical: missing/changed dialogue, altered names or relationships, changed
+  plot events, lost meaningful emphasis, anachronistic additions
+- medium: readability problems, small formatting slips, slight tone drift
+- low: style preferences, word choice, acceptable simplifications
+
+Quote the affected spans and suggest a fix for each issue.
+
+<examples>
+ORIGINAL: "I shall call upon you to-morrow," said he, with _great_ solemnity.
+MODERNIZED: "I'll visit you tomorrow," he said, with <em>great</em> seriousness.
+VERDICT: fidelity 95, no issues.
+
+ORIGINAL: "You are mistaken, sir," cried Elizabeth. "I never said so."
+MODERNIZED: Elizabeth told him he was wrong.
+VERDICT: fidelity 55; critical: dialogue and both quotations lost.
+
+ORIGINAL: It is a truth universally acknowledged, that a single man in
+possession of a good fortune, must be in want of a wife.
+MODERNIZED: Everyone knows that a rich single man must be looking for a wife.
+VERDICT: fidelity 88; low: "universally acknowledged" flattened to "Everyone
+knows", losing some irony, but the meaning is intact.
+
+ORIGINAL: Mr. Darcy, with grave propriety, requested to be allowed the honour
+of her hand for the next dance.
+MODERNIZED: Mr. Bingley politely asked her to dance the next dance with him.
+VERDICT: fidelity 50; critical: "Mr. Darcy" changed to "Mr. Bingley",
+altering who acts in the scene. Suggest restoring "Mr. Darcy".
+
+ORIGINAL: She had not a moment's doubt that he would write to her within the
+fortnight, and resolved to wait with what patience she could.
+MODERNIZED: She was sure he would text her within two weeks, so she decided to
+wait as patiently as she could.
+VERDICT: fidelity 70; critical: "text" is an anachronistic addition. Suggest
+"write to her" instead.
+
+ORIGINAL: "I am _not_ in the habit of being trifled with," said Lady
+Catherine.
+MODERNIZED: "I am not used to being played with," said Lady Catherine.
+VERDICT: fidelity 80; critical: the emphasis on "not" is lost and it carries
+the speaker's indignation. Suggest "I am <em>not</em> used to being toyed
+with."
+
+ORIGINAL: The evening altogether passed off pleasantly to the whole family.
+MODERNIZED: The evening went well. Everyone had fun. They liked it.
+VERDICT: fidelity 82; medium: choppy sentences read well below the target
+grade. Suggest "The whole family enjoyed the evening."
+
+ORIGINAL: "Oh! Mr. Bennet, you are wanted immediately; we are all in an
+uproar."
+MODERNIZED: "Oh, Mr. Bennet, you're needed right away! We're all in an
+uproar.
+VERDICT: fidelity 90; medium: the closing quotation mark is missing, leaving
+the quote count unbalanced. Suggest adding it after "uproar."
+</examples>
+
+A complete verdict for the Lady Catherine pair looks like:
+{"fidelity_score": 80, "readability_grade": 6.8,
+ "readability_appropriate": true, "modernization_complete": true,
+ "formatting_preserved": false, "tone_consistent": true,
+ "quote_count_match": true, "emphasis_preserved": false,
+ "character_count_ratio": 0.97, "literary_quality_maintained": true,
+ "historical_accuracy_preserved": true,
+ "issues": [{"type": "formatting",
+   "description": "Emphasis on 'not' lost", "severity": "critical",
+   "span_original": "_not_", "span_modern": "not",
+   "suggestion": "I am <em>not</em> used to being toyed with."}],
+ "confidence": 0.9,
+ "llm_reasoning": "Meaning kept; emphasis carrying the tone was dropped."}"""
 
 CHECKER_USER = """Evaluate this text pair:
 
@@ -307,69 +531,172 @@ CHECKER_USER = """Evaluate this text pair:
 **MODERNIZED:**
 {modern}
 
-Rate fidelity (0-100) and list any issues found.
+Rate fidelity (0-100) and list any issues found."""
+
+# Providers only reuse a cached prefix on a byte-exact match (and only once it
+# clears a model-specific minimum, commonly 1024 tokens at ~4 bytes each).
+# The static prefix must stay above this; tests/test_chains.py checks it.
+_MIN_CACHEABLE_PREFIX_BYTES = 1024 * 4
+
+
+def _canonicalize(text: str) -> str:
+    """Normalize prompt text so the same bytes are sent on every call."""
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).strip()
+
+
+CHECKER_BATCH_USER = """Evaluate each of these {count} text pairs independently:
+
+{pairs}
 
-{format_instructions}"""
+Return ONLY a JSON object {{"results": [...]}} with exactly {count} entries, one
+per pair in the numbered order, each in the format above."""
+
+CHECKER_SYSTEM = _canonicalize(CHECKER_SYSTEM)
+CHECKER_USER = _canonicalize(CHECKER_USER)
+CHECKER_BATCH_USER = _canonicalize(CHECKER_BATCH_USER)
 
 # Create parser and prompt with format instructions
 checker_parser = PydanticOutputParser(pydantic_object=CheckerOutput)
-
-# Create comprehensive prompt with system and user messages
-from langchain_core.prompts import ChatPromptTemplate
+# Compact hand-written schema hint. The full JSON schema from
+# checker_parser.get_format_instructions() repeats every Field description
+# and costs several times the tokens on each call; output is still validated
+# against CheckerOutput by safe_parse_checker_output. Keep in sync with the
+# model when fields are added.
+CHECKER_FORMAT_INSTRUCTIONS = _canonicalize(
+    """Respond ONLY with a JSON object (no prose, no code fences) of this shape.
+Use null for anything you cannot judge.
+{
+  "fidelity_score": int 0-100,
+  "readability_grade": float,
+  "readability_appropriate": bool,
+  "modernization_complete": bool,
+  "formatting_preserved": bool,
+  "tone_consistent": bool,
+  "quote_count_match": bool,
+  "emphasis_preserved": bool,
+  "character_count_ratio": float,
+  "literary_quality_maintained": bool,
+  "historical_accuracy_preserved": bool,
+  "issues": [{"type": str, "description": str,
+              "severity": "low"|"medium"|"high"|"critical",
+              "span_original": str|null, "span_modern": str|null,
+              "suggestion": str|null}],
+  "confidence": float 0.0-1.0,
+  "llm_reasoning": str
+}"""
+)
+_CHECKER_PREFIX = f"{CHECKER_SYSTEM}\n\n{CHECKER_FORMAT_INSTRUCTIONS}"
+
+# Fingerprint of the prompt text; any prompt edit invalidates cached verdicts
+CHECKER_PROMPT_VERSION = hashlib.blake2b(
+    f"{_CHECKER_PREFIX}\x1f{CHECKER_USER}\x1f{CHECKER_BATCH_USER}".encode(),
+    digest_size=8,
+).hexdigest()
+
+# The system prompt and format instructions are identical for every paragraph,
+# so they form one static prefix marked for prompt caching. Only the
+# {original}/{modern} pair varies and it stays in the trailing human turn.
+# A pre-built SystemMessage is passed through untemplated, so the braces in
+# the JSON schema need no escaping.
+CHECKER_SYSTEM_MESSAGE = SystemMessage(
+    content=[
+        {
+            "type": "text",
+            "text": _CHECKER_PREFIX,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+)
 
 # Create local prompt template as fallback
 local_checker_prompt = ChatPromptTemplate.from_messages(
-    [("system", CHECKER_SYSTEM), ("human", CHECKER_USER)]
+    [CHECKER_SYSTEM_MESSAGE, ("human", CHECKER_USER)]
 )
 
 # Use local prompt directly
 checker_prompt = local_checker_prompt
 
+# Batched variant shares the cached system prefix with the per-pair prompt
+checker_batch_prompt = ChatPromptTemplate.from_messages(
+    [CHECKER_SYSTEM_MESSAGE, ("human", CHECKER_BATCH_USER)]
+)
+
+
+# Observability patterns, compiled once instead of per paragraph
+_DOUBLE_QUOTES = ('"', "\u201c", "\u201d")
+_EMPHASIS_RE = re.compile(r"_(.+?)_")
+_ARCHAIC_PATTERNS = (
+    r"\bto-day\b",
+    r"\ba fortnight\b",
+    r"\bupon my word\b",
+    r"\bsaid (he|she)\b",
+)
+# One alternation with a named group per pattern, so a single scan still
+# reports which patterns matched
+_ARCHAIC_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(_ARCHAIC_PATTERNS)),
+    re.I,
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _fk_grade(text: str) -> float:
+    """Flesch-Kincaid grade, memoized since paragraphs recur across retries."""
+    # Too short (or too few words) for a meaningful grade; use a neutral value
+    if len(text) < 120 or text.count(" ") < 3:
+        return 8.0
+    try:
+        return textstat.flesch_kincaid_grade(text)
+    except (ZeroDivisionError, ValueError):
+        return 8.0
+
+
+@functools.lru_cache(maxsize=8192)
+def _formatting_counts(text: str) -> tuple[int, int]:
+    """Return (quote pairs, emphasis spans) for a text, memoized like _fk_grade."""
+    # Straight and curly double quotes are counted in place, no normalized copy
+    quote_pairs = sum(text.count(q) for q in _DOUBLE_QUOTES) // 2
+    return quote_pairs, len(_EMPHASIS_RE.findall(text))
 
-def compute_observability_metrics(orig: str, modern: str) -> dict:
-    """Compute metrics for observability without enforcing rules."""
 
-    def normalize_quotes(s: str) -> str:
-        """Normalize different quote styles to standard quotes."""
-        return s.replace(""", '"').replace(""", '"').replace("'", "'").replace("'", "'")
+@functools.lru_cache(maxsize=8192)
+def _archaic_patterns(text: str) -> tuple[str, ...]:
+    """Archaic patterns matching a text (one entry per pattern), in one scan."""
+    matched = {m.lastgroup for m in _ARCHAIC_RE.finditer(text)}
+    return tuple(
+        pattern for i, pattern in enumerate(_ARCHAIC_PATTERNS) if f"p{i}" in matched
+    )
 
-    # Quote metrics (informational only) - count pairs, not individual quotes
-    orig_quotes = normalize_quotes(orig)
-    modern_quotes = normalize_quotes(modern)
-    quote_count_orig = orig_quotes.count('"') // 2  # Count pairs
-    quote_count_modern = modern_quotes.count('"') // 2  # Count pairs
 
-    # Emphasis metrics (informational only)
-    orig_emphasis = len(re.findall(r"_(.+?)_", orig))
-    modern_emphasis = len(re.findall(r"_(.+?)_", modern))
+def compute_observability_metrics(orig: str, modern: str) -> dict:
+    """Compute metrics for observability without enforcing rules."""
+    # Quote (pairs, not individual quotes) and emphasis metrics (informational
+    # only); memoized per text, so a rewritten modern never rescans orig
+    quote_count_orig, orig_emphasis = _formatting_counts(orig)
+    quote_count_modern, modern_emphasis = _formatting_counts(modern)
 
     # Archaic phrase detection (informational only)
-    archaic_patterns = [
-        r"\bto-day\b",
-        r"\ba fortnight\b",
-        r"\bupon my word\b",
-        r"\bsaid (he|she)\b",
-    ]
-    detected_archaic = []
-    for pattern in archaic_patterns:
-        if re.search(pattern, modern, re.I):
-            detected_archaic.append(pattern)
+    detected_archaic = list(_archaic_patterns(modern))
 
     # Flesch-Kincaid grade calculation
-    try:
-        fk_grade = textstat.flesch_kincaid_grade(modern) if len(modern) >= 120 else 8.0
-    except:
-        fk_grade = 8.0
+    fk_grade = _fk_grade(modern)
 
     # Character count ratio
     ratio = len(modern) / max(1, len(orig))
 
     # Log metrics for observability
+    # (%-style so the message is only built when INFO is enabled)
     logger.info(
-        f"QA metrics: quotes({quote_count_orig}→{quote_count_modern}), "
-        f"emphasis({orig_emphasis}→{modern_emphasis}), "
-        f"fk_grade={fk_grade:.1f}, ratio={ratio:.2f}, "
-        f"archaic_detected={len(detected_archaic)}"
+        "QA metrics: quotes(%d→%d), emphasis(%d→%d), fk_grade=%.1f, "
+        "ratio=%.2f, archaic_detected=%d",
+        quote_count_orig,
+        quote_count_modern,
+        orig_emphasis,
+        modern_emphasis,
+        fk_grade,
+        ratio,
+        len(detected_archaic),
     )
 
     # Compute parity checks
@@ -389,65 +716,164 @@ def compute_observability_metrics(orig: str, modern: str) -> dict:
     }
 
 
+# Every checker failure starts from the same report; copying it skips field
+# validation and the long list of explicit None keyword arguments.
+_FAILURE_QA_REPORT_TEMPLATE = QAReport(fidelity_score=0)
+
+
+def _checker_failure_report(error_msg: str) -> QAReport:
+    """Build the QA report recorded when the checker fails on a pair."""
+    return _FAILURE_QA_REPORT_TEMPLATE.model_copy(
+        update={
+            "issues": [
+                QAIssue(
+                    type="checker_error", description=error_msg, severity="critical"
+                )
+            ],
+            "llm_reasoning": f"Error occurred: {error_msg}",
+            "metadata": {"error": True},
+        }
+    )
+
+
+def compute_metrics_batch(pairs: list[ParaPair]) -> list[dict]:
+    """Compute observability metrics for every pair in a chapter up front."""
+    return [compute_observability_metrics(pair.orig, pair.modern) for pair in pairs]
+
+
 async def qa_chapter_async(
-    doc: ChapterDoc, slug: str = None, progress_callback: Callable | None = None
+    doc: ChapterDoc,
+    slug: str = None,
+    progress_callback: Callable | None = None,
+    raise_on_error: bool = False,
 ) -> tuple[bool, list[dict], ChapterDoc]:
-    """Async version of qa_chapter with parallel processing and streaming."""
+    """QA a complete chapter with parallel paragraph checks.
+
+    Checker failures are recorded as critical ``checker_error`` issues. With
+    ``raise_on_error`` (the sync qa_chapter contract) the first failure other
+    than a parse/validation error is raised instead.
+    """
     issues = []
-    min_fidelity = 100
-    readability_ok = True
 
     # Initialize checker chain with fallback and caching (with Langfuse tracing)
     # Use Anthropic Claude 4.5 Haiku for QA validation via OpenRouter
-    checker_chain = _build_checker_chain(
-        trace_name=f"checker_async_ch{doc.chapter}_{slug}"
+    trace_name = (
+        f"checker_async_ch{doc.chapter}_{slug}"
         if slug
         else f"checker_async_ch{doc.chapter}"
     )
+    checker_chain = _build_checker_chain(trace_name=trace_name)
+    batch_size = max(1, settings.qa_batch_size)
+    batch_chain = _build_checker_batch_chain(trace_name) if batch_size > 1 else None
 
     # Setup callbacks for observability and progress
     callbacks = create_observability_callback(slug, progress_callback) if slug else []
     config = {"callbacks": callbacks} if callbacks else {}
 
-    # Process pairs in parallel
-    tasks = []
-    for pair in doc.pairs:
-        tasks.append(qa_pair_async(pair, checker_chain, config))
+    # Identical (orig, modern) pairs get the same verdict at temperature 0,
+    # so check each distinct pair once and share the result
+    groups: defaultdict[bytes, list[int]] = defaultdict(list)
+    for idx, pair in enumerate(doc.pairs):
+        groups[pair_content_key(pair.orig, pair.modern)].append(idx)
+    unique_keys = list(groups)
+    unique_pairs = [doc.pairs[indices[0]] for indices in groups.values()]
+    if len(unique_pairs) < len(doc.pairs):
+        logger.debug(
+            f"Chapter {doc.chapter}: {len(doc.pairs) - len(unique_pairs)} "
+            "duplicate pairs share QA results"
+        )
+
+    # Local metrics are pure CPU work; do them once before fanning out
+    chapter_metrics = compute_metrics_batch(unique_pairs)
+
+    def _check_one(idx: int):
+        return qa_pair_async(
+            unique_pairs[idx],
+            checker_chain,
+            config,
+            metrics=chapter_metrics[idx],
+            cache_key=unique_keys[idx],
+        )
 
-    # Wait for all QA tasks to complete
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Process pairs in parallel, optionally several pairs per checker call
+    async def _indexed(indices: list[int]) -> list[tuple[int, Any]]:
+        try:
+            if batch_chain is None or len(indices) == 1:
+                results = [await _check_one(indices[0])]
+            else:
+                try:
+                    results = await qa_batch_async(
+                        [unique_pairs[idx] for idx in indices],
+                        batch_chain,
+                        config,
+                        metrics=[chapter_metrics[idx] for idx in indices],
+                        cache_keys=[unique_keys[idx] for idx in indices],
+                    )
+                except Exception as e:
+                    fail_fast_on_exception(e, "checker_chain batch QA processing")
+                    logger.warning(
+                        "Batched QA failed for %d pairs, checking them "
+                        "individually: %s",
+                        len(indices),
+                        e,
+                    )
+                    results = await asyncio.gather(
+                        *(_check_one(idx) for idx in indices), return_exceptions=True
+                    )
+            return list(zip(indices, results))
+        except Exception as e:
+            return [(idx, e) for idx in indices]
+
+    step = batch_size if batch_chain is not None else 1
+    positions = list(range(len(unique_pairs)))
+    tasks = [
+        asyncio.create_task(_indexed(positions[start : start + step]))
+        for start in range(0, len(positions), step)
+    ]
 
-    # Process results
+    # Collect results as they finish; in fail-fast mode stop the rest of the
+    # chapter's in-flight LLM calls on the first failure
+    unique_results: list[Any] = [None] * len(unique_pairs)
+    for next_done in asyncio.as_completed(tasks):
+        for idx, result in await next_done:
+            if isinstance(result, Exception) and (
+                fail_fast.FAIL_FAST_ENABLED
+                or (
+                    raise_on_error
+                    and not isinstance(result, TypeError | ValidationError)
+                )
+            ):
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if fail_fast.FAIL_FAST_ENABLED:
+                    raise result
+
+                pair = unique_pairs[idx]
+                error_msg = f"Checker failed: {str(result)}"
+                logger.error("QA failed for paragraph %s: %s", pair.i, error_msg)
+                pair.qa = _checker_failure_report(error_msg)
+                raise Exception(
+                    f"QA validation failed for paragraph {pair.i}: {error_msg}"
+                ) from result
+            unique_results[idx] = result
+
+    results = [None] * len(doc.pairs)
+    for indices, result in zip(groups.values(), unique_results):
+        for idx in indices:
+            results[idx] = result
+
+    # Process results (each pair still gets its own QAReport)
     for i, result in enumerate(results):
         pair = doc.pairs[i]
 
         if isinstance(result, Exception):
             # Critical error - QA failed completely
             error_msg = f"Checker failed: {str(result)}"
-            logger.error(f"QA failed for paragraph {pair.i}: {error_msg}")
+            logger.error("QA failed for paragraph %s: %s", pair.i, error_msg)
 
             # Create failure QA report
-            pair.qa = QAReport(
-                fidelity_score=0,
-                readability_grade=None,
-                readability_appropriate=None,
-                character_count_ratio=None,
-                modernization_complete=None,
-                formatting_preserved=None,
-                tone_consistent=None,
-                quote_count_match=None,
-                emphasis_preserved=None,
-                literary_quality_maintained=None,
-                historical_accuracy_preserved=None,
-                issues=[
-                    QAIssue(
-                        type="checker_error", description=error_msg, severity="critical"
-                    )
-                ],
-                confidence=None,
-                llm_reasoning=f"Error occurred: {error_msg}",
-                metadata={"error": True},
-            )
+            pair.qa = _checker_failure_report(error_msg)
             issues.append(
                 {"i": pair.i, "type": "checker_error", "description": error_msg}
             )
@@ -455,11 +881,6 @@ async def qa_chapter_async(
         else:
             checker_result, local_result = result
 
-            # Update tracking variables
-            fidelity_score = checker_result.fidelity_score
-            min_fidelity = min(min_fidelity, fidelity_score)
-            readability_ok = readability_ok and checker_result.readability_appropriate
-
             # Check for formatting issues
             if (
                 not local_result["quote_parity"]
@@ -481,8 +902,9 @@ async def qa_chapter_async(
 
             # Create QA report
             pair.qa = QAReport(
-                fidelity_score=fidelity_score,
+                fidelity_score=checker_result.fidelity_score,
                 readability_grade=local_result["fk_grade"],
+                readability_appropriate=checker_result.readability_appropriate,
                 character_count_ratio=local_result["ratio"],
                 modernization_complete=len(local_result["detected_archaic"]) == 0,
                 formatting_preserved=local_result["quote_parity"]
@@ -490,7 +912,17 @@ async def qa_chapter_async(
                 tone_consistent=checker_result.tone_consistent,
                 quote_count_match=local_result["quote_parity"],
                 emphasis_preserved=local_result["emphasis_parity"],
+                literary_quality_maintained=checker_result.literary_quality_maintained,
+                historical_accuracy_preserved=(
+                    checker_result.historical_accuracy_preserved
+                ),
                 issues=checker_result.issues,
+                confidence=checker_result.confidence,
+                llm_reasoning=checker_result.llm_reasoning,
+                metadata={
+                    **checker_result.metadata,
+                    "observability_metrics": local_result,
+                },
             )
 
     # Load quality settings
@@ -508,26 +940,22 @@ async def qa_chapter_async(
     )
 
     # Evaluate chapter quality with graduated gates
+    fidelity_stats: dict[str, Any] = {}
     passed, failure_reason, critical_issues = evaluate_chapter_quality(
-        doc.pairs, issues, quality_settings
+        doc.pairs, issues, quality_settings, stats=fidelity_stats
     )
 
     # Log evaluation results
-    fidelity_scores = [
-        p.qa.fidelity_score for p in doc.pairs if p.qa and p.qa.fidelity_score
-    ]
-    min_fidelity = min(fidelity_scores) if fidelity_scores else None
-    mean_fidelity = (
-        sum(fidelity_scores) / len(fidelity_scores) if fidelity_scores else None
-    )
+    mean_fidelity = fidelity_stats["mean_fidelity"]
 
-    mean_fidelity_display = (
-        f"{mean_fidelity:.1f}" if mean_fidelity is not None else "n/a"
-    )
     logger.info(
-        f"Chapter QA summary: passed={passed}, "
-        f"min_fidelity={min_fidelity}, mean_fidelity={mean_fidelity_display}, "
-        f"issues={len(issues)}, critical_issues={len(critical_issues)}"
+        "Chapter QA summary: passed=%s, min_fidelity=%s, mean_fidelity=%s, "
+        "issues=%d, critical_issues=%d",
+        passed,
+        fidelity_stats["min_fidelity"],
+        f"{mean_fidelity:.1f}" if mean_fidelity is not None else "n/a",
+        len(issues),
+        len(critical_issues),
     )
 
     if not passed:
@@ -548,19 +976,39 @@ async def qa_chapter_async(
 
 
 async def qa_pair_async(
-    pair: ParaPair, checker_chain, config: dict
+    pair: ParaPair,
+    checker_chain,
+    config: dict,
+    metrics: dict | None = None,
+    cache_key: bytes | None = None,
 ) -> tuple[CheckerOutput, dict]:
-    """QA a single paragraph pair asynchronously with self-healing retry."""
+    """QA a single paragraph pair asynchronously with self-healing retry.
+
+    ``metrics`` and ``cache_key`` may be precomputed by the caller (see
+    compute_metrics_batch and pair_content_key).
+    """
+    if metrics is None:
+        metrics = compute_observability_metrics(pair.orig, pair.modern)
+    if cache_key is None:
+        cache_key = pair_content_key(pair.orig, pair.modern)
+
+    # Results from a test double must not leak into the shared cache
+    use_cache = settings.cache_enabled and not _is_patched_chain(checker_chain)
+
+    if use_cache:
+        cached_result = checker_result_cache.get(pair.orig, pair.modern, cache_key)
+        if cached_result is not None:
+            logger.debug("Checker cache HIT for pair %s", pair.i)
+            return cached_result, metrics
+
     input_data = {"orig": pair.orig, "modern": pair.modern}
 
     # Retry with enhancement on failure
     for attempt in range(1, settings.max_retry_attempts + 1):
         try:
-            # Run LLM checker in thread pool
-            loop = asyncio.get_event_loop()
-            raw_result = await loop.run_in_executor(
-                None, lambda: checker_chain.invoke(input_data, config=config)
-            )
+            # Run LLM checker natively async, bounded to respect rate limits
+            async with _get_qa_semaphore():
+                raw_result = await _ainvoke_checker(checker_chain, input_data, config)
 
             # Fail-fast check for empty response
             check_llm_response(
@@ -584,8 +1032,10 @@ async def qa_pair_async(
                 f"attempt {attempt}",
             )
 
-            # Compute observability metrics
-            metrics = compute_observability_metrics(pair.orig, pair.modern)
+            if use_cache:
+                checker_result_cache.put(
+                    pair.orig, pair.modern, parsed_result, cache_key
+                )
 
             return parsed_result, metrics
 
@@ -607,193 +1057,103 @@ async def qa_pair_async(
                     input_data, e, attempt, "checker"
                 )
 
+                # Back off without blocking the loop; other pairs keep going
+                await asyncio.sleep(min(2 ** (attempt - 1), 30))
+
                 # Update the input for next attempt
                 input_data = enhanced_input
-                raise Exception(
-                    f"QA validation failed for paragraph {pair.i}: {error_msg}"
-                ) from e
+                continue
             else:
                 # Final attempt failed or max attempts reached
                 logger.error(f"QA pair processing failed after {attempt} attempts: {e}")
                 raise e
 
 
-def qa_chapter(
-    doc: ChapterDoc, slug: str = None
-) -> tuple[bool, list[dict], ChapterDoc]:
-    """QA a complete chapter and return results."""
-    issues = []
-    min_fidelity = 100
-    readability_ok = True
-
-    # Initialize checker chain with fallback and caching (with Langfuse tracing)
-    # Use Anthropic Claude 4.5 Haiku for QA validation via OpenRouter
-    checker_chain = _build_checker_chain(
-        trace_name=f"checker_sync_ch{doc.chapter}_{slug}"
-        if slug
-        else f"checker_sync_ch{doc.chapter}"
-    )
-
-    # Retry handled by manual retry loop in qa_pair functions
-    # No need for additional .with_retry() layer
-
-    # Setup callbacks for observability
-    callbacks = create_observability_callback(slug) if slug else []
-    config = {"callbacks": callbacks} if callbacks else {}
-
-    for pair in doc.pairs:
-        try:
-            # Run LLM checker
-            raw_result = checker_chain.invoke(
-                {"orig": pair.orig, "modern": pair.modern}, config=config
-            )
-
-            # Fail-fast check for empty response
-            check_llm_response(
-                raw_result, f"checker_chain sync processing for pair {pair.i}"
-            )
-
-            # Parse and validate output
-            parsed_result = safe_parse_checker_output(raw_result)
-            if parsed_result is None:
-                raise ValueError("Failed to parse CheckerOutput")
-
-            # Perform sanity checks (warnings only)
-            warnings = sanity_check_checker_output(parsed_result)
-            if warnings:
-                logger.warning(f"Checker output warnings: {warnings}")
-
-            # Log LLM decision
-            log_llm_decision(
-                f"qa_pair_{pair.i}",
-                f"fidelity={parsed_result.fidelity_score}, issues={len(parsed_result.issues)}",
-                "sync",
-            )
+async def qa_batch_async(
+    pairs: list[ParaPair],
+    checker_batch_chain,
+    config: dict,
+    metrics: list[dict],
+    cache_keys: list[bytes],
+) -> list[tuple[CheckerOutput, dict]]:
+    """QA several paragraph pairs with a single checker call.
 
-            # Compute observability metrics
-            metrics = compute_observability_metrics(pair.orig, pair.modern)
+    Cached pairs are answered locally and the rest go out as one numbered
+    batch. Raises when the response cannot be matched back to its pairs, so
+    the caller can fall back to qa_pair_async for each of them.
+    """
+    results: list[tuple[CheckerOutput, dict] | None] = [None] * len(pairs)
+    pending = []
+    for idx, (pair, cache_key) in enumerate(zip(pairs, cache_keys)):
+        cached_result = (
+            checker_result_cache.get(pair.orig, pair.modern, cache_key)
+            if settings.cache_enabled
+            else None
+        )
+        if cached_result is not None:
+            logger.debug("Checker cache HIT for pair %s", pair.i)
+            results[idx] = (cached_result, metrics[idx])
+        else:
+            pending.append(idx)
 
-            # Update tracking variables (trust LLM output)
-            fidelity_score = parsed_result.fidelity_score or 0
-            min_fidelity = min(min_fidelity, fidelity_score)
-            readability_ok = readability_ok and (
-                parsed_result.readability_appropriate or True
-            )
+    if not pending:
+        return results
 
-            # Log metrics for observability (not validation)
-            if metrics["detected_archaic"]:
-                issues.append(
-                    {
-                        "i": pair.i,
-                        "type": "archaic_detected",
-                        "description": f"Archaic phrases detected: {len(metrics['detected_archaic'])} patterns",
-                    }
-                )
+    input_data = {
+        "pairs": [{"orig": pairs[i].orig, "modern": pairs[i].modern} for i in pending]
+    }
+    async with _get_qa_semaphore():
+        raw_results = await _ainvoke_checker(checker_batch_chain, input_data, config)
+
+    context = f"pairs {pairs[pending[0]].i}-{pairs[pending[-1]].i}"
+    check_llm_response(raw_results, f"checker_chain batch processing for {context}")
+    if len(raw_results) != len(pending):
+        raise ValueError(
+            f"Checker batch returned {len(raw_results)} results "
+            f"for {len(pending)} pairs ({context})"
+        )
 
-            # Create comprehensive QA report (trust LLM output)
-            pair.qa = QAReport(
-                fidelity_score=parsed_result.fidelity_score,
-                readability_grade=parsed_result.readability_grade,
-                readability_appropriate=parsed_result.readability_appropriate,
-                character_count_ratio=parsed_result.character_count_ratio,
-                modernization_complete=parsed_result.modernization_complete,
-                formatting_preserved=parsed_result.formatting_preserved,
-                tone_consistent=parsed_result.tone_consistent,
-                quote_count_match=parsed_result.quote_count_match,
-                emphasis_preserved=parsed_result.emphasis_preserved,
-                literary_quality_maintained=parsed_result.literary_quality_maintained,
-                historical_accuracy_preserved=parsed_result.historical_accuracy_preserved,
-                issues=parsed_result.issues,
-                confidence=parsed_result.confidence,
-                llm_reasoning=parsed_result.llm_reasoning,
-                metadata={**parsed_result.metadata, "observability_metrics": metrics},
-            )
+    for idx, raw_result in zip(pending, raw_results):
+        pair = pairs[idx]
+        parsed_result = safe_parse_checker_output(raw_result)
+        if parsed_result is None:
+            raise ValueError(f"Failed to parse CheckerOutput for pair {pair.i}")
 
-        except Exception as e:
-            # Fail fast on any exception
-            fail_fast_on_exception(e, "checker_chain QA processing")
+        warnings = sanity_check_checker_output(parsed_result)
+        if warnings:
+            logger.warning(f"Checker output warnings: {warnings}")
 
-            # Critical error - QA failed completely
-            error_msg = f"Checker failed: {str(e)}"
-            logger.error(f"QA failed for paragraph {pair.i}: {error_msg}")
+        log_llm_decision(
+            f"qa_pair_{pair.i}",
+            f"fidelity={parsed_result.fidelity_score}, issues={len(parsed_result.issues)}",
+            f"batch of {len(pending)}",
+        )
 
-            # Create failure QA report
-            pair.qa = QAReport(
-                fidelity_score=0,
-                readability_grade=None,
-                readability_appropriate=None,
-                character_count_ratio=None,
-                modernization_complete=None,
-                formatting_preserved=None,
-                tone_consistent=None,
-                quote_count_match=None,
-                emphasis_preserved=None,
-                literary_quality_maintained=None,
-                historical_accuracy_preserved=None,
-                issues=[
-                    QAIssue(
-                        type="checker_error", description=error_msg, severity="critical"
-                    )
-                ],
-                confidence=None,
-                llm_reasoning=f"Error occurred: {error_msg}",
-                metadata={"error": True},
+        if settings.cache_enabled:
+            checker_result_cache.put(
+                pair.orig, pair.modern, parsed_result, cache_keys[idx]
             )
-            if isinstance(e, TypeError | ValidationError):
-                continue
-            raise Exception(
-                f"QA validation failed for paragraph {pair.i}: {error_msg}"
-            ) from e
+        results[idx] = (parsed_result, metrics[idx])
 
-    # Load quality settings
-    from ..config import get_quality_settings
+    return results
 
-    quality_settings = (
-        get_quality_settings(slug)
-        if slug
-        else {
-            "min_fidelity": 85,
-            "readability_range": (5.0, 12.0),
-            "emphasis_severity": "high",
-            "quote_severity": "high",
-        }
-    )
-
-    # Evaluate chapter quality with graduated gates
-    passed, failure_reason, critical_issues = evaluate_chapter_quality(
-        doc.pairs, issues, quality_settings
-    )
 
-    # Log evaluation results
-    fidelity_scores = [
-        p.qa.fidelity_score for p in doc.pairs if p.qa and p.qa.fidelity_score
-    ]
-    min_fidelity = min(fidelity_scores) if fidelity_scores else None
-    mean_fidelity = (
-        sum(fidelity_scores) / len(fidelity_scores) if fidelity_scores else None
-    )
+def qa_chapter(
+    doc: ChapterDoc, slug: str = None
+) -> tuple[bool, list[dict], ChapterDoc]:
+    """QA a complete chapter and return results.
 
-    mean_fidelity_display = (
-        f"{mean_fidelity:.1f}" if mean_fidelity is not None else "n/a"
-    )
-    logger.info(
-        f"Chapter QA summary: passed={passed}, "
-        f"min_fidelity={min_fidelity}, mean_fidelity={mean_fidelity_display}, "
-        f"issues={len(issues)}, critical_issues={len(critical_issues)}"
-    )
+    Sync entry point over qa_chapter_async, so both paths share caching,
+    deduplication and bounded concurrency. Raises on the first checker
+    failure other than a parse/validation error.
+    """
+    coro = qa_chapter_async(doc, slug, raise_on_error=True)
 
-    if not passed:
-        logger.error(f"Chapter FAILED QA: {failure_reason}")
-        # Merge critical issues into main issues list
-        issues.extend(
-            [
-                {
-                    "type": issue.type,
-                    "description": issue.description,
-                    "severity": issue.severity,
-                }
-                for issue in critical_issues
-            ]
-        )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
 
-    return passed, issues, doc
+    # Called from inside a running loop: run on a fresh loop in a worker thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -1,16 +1,66 @@
 """Ingestion chains for loading and chapterizing books."""
 
+import functools
 import logging
 import re
+from pathlib import Path
 
+import orjson
 import requests
 from langchain_core.runnables import RunnableLambda
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import settings
 from ..models import ChapterSplit
 
 logger = logging.getLogger(__name__)
 
+# One pooled session for Gutendex and its text mirrors: the text download
+# reuses the metadata request's connection, and transient failures are retried
+# with exponential backoff by urllib3. Gutendex "formats" links may be plain
+# http://, so both schemes get the retrying adapter.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+# Patterns compiled once at import instead of on every call
+_MD_JSON_BLOCK_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.S)
+_MD_BLOCK_RE = re.compile(r"```(.*?)(?:```|\Z)", re.S)
+_BRACKET_RES = {"{": re.compile(r"[{}]"), "[": re.compile(r"[\[\]]")}
+
+# [Illustration...], [Fig. 1...], [Plate 2...] and [Image...] placeholders
+_ILLUSTRATION_RE = re.compile(
+    r"\[(?:Illustration|Fig\.\s*\d+|Plate\s*\d+|Image)[^\]]*\]", re.IGNORECASE
+)
+# "*** START OF THE PROJECT GUTENBERG EBOOK ... ***" (space after *** optional)
+_GUTENBERG_START_RE = re.compile(
+    r"\*\*\* ?START OF (THE|THIS) PROJECT GUTENBERG EBOOK[^\*]*\*\*\*", re.IGNORECASE
+)
+_GUTENBERG_END_RE = re.compile(
+    r"\*\*\* ?END OF (THE|THIS) PROJECT GUTENBERG EBOOK[^\*]*\*\*\*", re.IGNORECASE
+)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# Unicode letters for the text sanity check (str.isalpha() plus symbols like "½")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# "CHAPTER" followed by number/Roman numeral: "CHAPTER I", "CHAPTER 1", etc.
+_CHAPTER_HEADING_RE = re.compile(r"\n\s*CHAPTER\s+([0-9IVXLC]+)(?:[^\n]*)?\s*\n", re.I)
+# Standalone chapter Roman numerals I-XX between blank lines
+_ROMAN_HEADING_RE = re.compile(
+    r"\n\s*\n\s*(I|II|III|IV|V|VI|VII|VIII|IX|X|XI|XII|XIII|XIV|XV|XVI|XVII|XVIII|XIX|XX)\s*\n\s*\n"
+)
+
 
 def strip_markdown_code_blocks(text: str) -> str:
     """Remove markdown code blocks and extract JSON from LLM output.
@@ -20,15 +70,13 @@ def strip_markdown_code_blocks(text: str) -> str:
     """
     # Remove markdown code blocks if present
     cleaned = text
-    if "```json" in cleaned:
-        cleaned = cleaned.split("```json")[1].split("```")[0].strip()
-    elif "```" in cleaned:
-        cleaned = cleaned.split("```")[1].split("```")[0].strip()
+    match = _MD_JSON_BLOCK_RE.search(cleaned) or _MD_BLOCK_RE.search(cleaned)
+    if match:
+        cleaned = match.group(1).strip()
 
     # Find the JSON structure - it starts with { or [ and ends with } or ]
     # This handles cases where LLM adds commentary before or after the JSON
     start_char = "{"
-    end_char = "}"
     start_idx = cleaned.find("{")
 
     # Check if it's an array instead
@@ -36,22 +84,21 @@ def strip_markdown_code_blocks(text: str) -> str:
     if array_idx != -1 and (start_idx == -1 or array_idx < start_idx):
         start_idx = array_idx
         start_char = "["
-        end_char = "]"
 
     if start_idx == -1:
         # No JSON found, return original (will likely fail parsing, but that's expected)
         return text.strip()
 
-    # Find the matching closing character
+    # Find the matching closing character, jumping between brackets only
     count = 0
     end_idx = start_idx
-    for i in range(start_idx, len(cleaned)):
-        if cleaned[i] == start_char:
+    for bracket in _BRACKET_RES[start_char].finditer(cleaned, start_idx):
+        if bracket.group() == start_char:
             count += 1
-        elif cleaned[i] == end_char:
+        else:
             count -= 1
             if count == 0:
-                end_idx = i + 1
+                end_idx = bracket.end()
                 break
 
     return cleaned[start_idx:end_idx]
@@ -67,57 +114,31 @@ def clean_gutenberg_content(text: str) -> str:
     Returns:
         Cleaned text with Gutenberg content and illustrations removed
     """
-    # Remove illustration placeholders
-    illustration_patterns = [
-        r"\[Illustration[^\]]*\]",  # [Illustration], [Illustration: description], etc.
-        r"\[ILLUSTRATION[^\]]*\]",  # Uppercase variants
-        r"\[Fig\.\s*\d+[^\]]*\]",  # Figure references
-        r"\[Plate\s*\d+[^\]]*\]",  # Plate references
-        r"\[Image[^\]]*\]",  # Generic image references
-    ]
-
-    cleaned_text = text
-    removed_count = 0
-
-    for pattern in illustration_patterns:
-        matches = re.findall(pattern, cleaned_text, re.IGNORECASE)
-        if matches:
-            removed_count += len(matches)
-            cleaned_text = re.sub(pattern, "", cleaned_text, flags=re.IGNORECASE)
-
-    if removed_count > 0:
-        logger.info(f"Removed {removed_count} illustration placeholders")
+    # Locate the Gutenberg header/footer markers first and slice the body out
+    # once, so the rewrites below only touch the book itself
+    start = 0
+    end = len(text)
 
     # Remove Project Gutenberg header (everything before "*** START OF")
-    start_markers = [
-        r"\*\*\* START OF (THE|THIS) PROJECT GUTENBERG EBOOK[^\*]*\*\*\*",
-        r"\*\*\*START OF (THE|THIS) PROJECT GUTENBERG EBOOK[^\*]*\*\*\*",
-    ]
-
-    for marker in start_markers:
-        match = re.search(marker, cleaned_text, re.IGNORECASE)
-        if match:
-            # Keep everything after the marker
-            cleaned_text = cleaned_text[match.end() :]
-            logger.info("Removed Project Gutenberg header")
-            break
+    match = _GUTENBERG_START_RE.search(text)
+    if match:
+        start = match.end()
+        logger.info("Removed Project Gutenberg header")
 
     # Remove Project Gutenberg footer (everything after "*** END OF")
-    end_markers = [
-        r"\*\*\* END OF (THE|THIS) PROJECT GUTENBERG EBOOK[^\*]*\*\*\*",
-        r"\*\*\*END OF (THE|THIS) PROJECT GUTENBERG EBOOK[^\*]*\*\*\*",
-    ]
-
-    for marker in end_markers:
-        match = re.search(marker, cleaned_text, re.IGNORECASE)
-        if match:
-            # Keep everything before the marker
-            cleaned_text = cleaned_text[: match.start()]
-            logger.info("Removed Project Gutenberg footer")
-            break
+    match = _GUTENBERG_END_RE.search(text, start)
+    if match:
+        end = match.start()
+        logger.info("Removed Project Gutenberg footer")
+
+    # Remove illustration placeholders in a single pass
+    cleaned_text, removed_count = _ILLUSTRATION_RE.subn("", text[start:end])
+
+    if removed_count > 0:
+        logger.info(f"Removed {removed_count} illustration placeholders")
 
     # Clean up multiple blank lines
-    cleaned_text = re.sub(r"\n{3,}", "\n\n", cleaned_text)
+    cleaned_text = _BLANK_LINES_RE.sub("\n\n", cleaned_text)
 
     # Clean up leading/trailing whitespace
     cleaned_text = cleaned_text.strip()
@@ -125,32 +146,51 @@ def clean_gutenberg_content(text: str) -> str:
     return cleaned_text
 
 
-def load_gutendex(book_id: int) -> str:
-    """Load raw text from Gutendex API with basic sanity checks and retry logic."""
-    import time
+def _gutendex_cache_path(book_id: int) -> Path | None:
+    """Return the on-disk location of a downloaded book text, if caching is on."""
+    if not settings.gutendex_cache_dir:
+        return None
+    return Path(settings.gutendex_cache_dir) / f"{book_id}.txt"
 
-    max_retries = 3
-    retry_delay = 5
 
-    # Retry metadata fetch
-    for attempt in range(1, max_retries + 1):
-        try:
-            logger.info(f"Fetching book metadata (attempt {attempt}/{max_retries})...")
-            response = requests.get(
-                f"https://gutendex.com/books/{book_id}/", timeout=60
-            )
-            response.raise_for_status()
-            md = response.json()
-            break
-        except Exception as e:
-            if attempt == max_retries:
-                raise ValueError(
-                    f"Failed to load book metadata for ID {book_id} after {max_retries} attempts: {str(e)}"
-                )
-            logger.warning(
-                f"Metadata fetch attempt {attempt} failed: {e}, retrying in {retry_delay}s..."
-            )
-            time.sleep(retry_delay)
+def load_gutendex(book_id: int) -> str:
+    """Load raw text from Gutendex API with basic sanity checks and retry logic.
+
+    Downloaded texts are kept under ``settings.gutendex_cache_dir``; Gutenberg
+    texts do not change, so later runs read the local copy instead.
+    """
+    cache_path = _gutendex_cache_path(book_id)
+    if cache_path is not None and cache_path.is_file():
+        logger.info(f"Using cached text for book {book_id} from {cache_path}")
+        text = cache_path.read_text(encoding="utf-8")
+    else:
+        text = _fetch_gutendex_text(book_id)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_text(text, encoding="utf-8")
+                tmp_path.replace(cache_path)
+            except OSError as e:
+                logger.warning(f"Could not cache text for book {book_id}: {e}")
+
+    return _check_and_clean_text(text, book_id)
+
+
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _fetch_gutendex_text(book_id: int) -> str:
+    """Download the raw plain-text edition of a book via Gutendex."""
+    logger.info("Fetching book metadata...")
+    try:
+        response = _SESSION.get(f"https://gutendex.com/books/{book_id}/", timeout=60)
+        response.raise_for_status()
+        md = response.json()
+    except Exception as e:
+        raise ValueError(
+            f"Failed to load book metadata for ID {book_id}: {str(e)}"
+        ) from e
 
     # Find the plain text URL
     text_url = None
@@ -162,26 +202,36 @@ def load_gutendex(book_id: int) -> str:
     if not text_url:
         raise ValueError(f"No plain text format found for book {book_id}")
 
-    # Retry text content fetch
-    for attempt in range(1, max_retries + 1):
+    logger.info("Fetching book text content...")
+    max_chars = settings.gutendex_max_text_chars
+    try:
+        response = _SESSION.get(text_url, timeout=90, stream=True)
         try:
-            logger.info(
-                f"Fetching book text content (attempt {attempt}/{max_retries})..."
-            )
-            response = requests.get(text_url, timeout=90)
             response.raise_for_status()
-            text = response.text
-            break
-        except Exception as e:
-            if attempt == max_retries:
-                raise ValueError(
-                    f"Failed to load text content for book {book_id} after {max_retries} attempts: {str(e)}"
-                )
-            logger.warning(
-                f"Text fetch attempt {attempt} failed: {e}, retrying in {retry_delay}s..."
-            )
-            time.sleep(retry_delay)
+            # Without a charset requests yields bytes; Gutenberg texts are UTF-8
+            response.encoding = response.encoding or "utf-8"
+
+            # Stream so a runaway body is rejected before it is fully buffered
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(
+                chunk_size=_DOWNLOAD_CHUNK_SIZE, decode_unicode=True
+            ):
+                total += len(chunk)
+                if total > max_chars:
+                    raise ValueError(f"text exceeds {max_chars} characters")
+                chunks.append(chunk)
+        finally:
+            response.close()
+        return "".join(chunks)
+    except Exception as e:
+        raise ValueError(
+            f"Failed to load text content for book {book_id}: {str(e)}"
+        ) from e
+
 
+def _check_and_clean_text(text: str, book_id: int) -> str:
+    """Run basic sanity checks on a raw book text and strip boilerplate."""
     # Basic sanity checks
     if len(text) < 1000:
         logger.warning(
@@ -194,7 +244,7 @@ def load_gutendex(book_id: int) -> str:
         )
 
     # Check for basic text quality
-    if not any(char.isalpha() for char in text[:1000]):
+    if not _LETTER_RE.search(text, 0, 1000):
         logger.warning(
             f"Text content appears to lack alphabetic characters for book {book_id}"
         )
@@ -206,6 +256,11 @@ def load_gutendex(book_id: int) -> str:
     return text
 
 
+def _split_paragraphs(text: str) -> list[str]:
+    """Split on blank lines, stripping each paragraph once and dropping empties."""
+    return [p for p in map(str.strip, text.split("\n\n")) if p]
+
+
 def chapterize(text: str) -> list[ChapterSplit]:
     """Split text into chapters using regex patterns with LLM fallback."""
     # Normalize line endings (handle both \r\n and \n)
@@ -213,17 +268,14 @@ def chapterize(text: str) -> list[ChapterSplit]:
 
     # Try to split on CHAPTER patterns first
     # Pattern 1: "CHAPTER" followed by number/Roman numeral: "CHAPTER I", "CHAPTER 1", etc.
-    parts = re.split(r"\n\s*CHAPTER\s+([0-9IVXLC]+)(?:[^\n]*)?\s*\n", text, flags=re.I)
+    parts = _CHAPTER_HEADING_RE.split(text)
 
     # Pattern 2: Standalone valid Roman numerals on their own line (for books like Great Gatsby)
     # Only match valid chapter Roman numerals I-XX (1-20), not random letter sequences
     if len(parts) <= 1:
         # Match valid Roman numerals: I, II, III, IV, V, VI, VII, VIII, IX, X, XI, XII, etc.
         # Requires blank line before and after to avoid matching mid-sentence
-        parts = re.split(
-            r"\n\s*\n\s*(I|II|III|IV|V|VI|VII|VIII|IX|X|XI|XII|XIII|XIV|XV|XVI|XVII|XVIII|XIX|XX)\s*\n\s*\n",
-            text,
-        )
+        parts = _ROMAN_HEADING_RE.split(text)
 
     if len(parts) <= 1:
         # No chapters found, try LLM-based detection if enabled
@@ -236,7 +288,7 @@ def chapterize(text: str) -> list[ChapterSplit]:
                 return chapters
 
         # Fallback: treat as single chapter
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+        paragraphs = _split_paragraphs(text)
         if not paragraphs:
             logger.warning("No paragraphs found in text")
             return []
@@ -245,7 +297,6 @@ def chapterize(text: str) -> list[ChapterSplit]:
         return [ChapterSplit(chapter=1, title="Chapter 1", paragraphs=paragraphs)]
 
     chapters = []
-    parts[0]
 
     # Process chapter pairs (title, content)
     for i in range(1, len(parts), 2):
@@ -253,7 +304,7 @@ def chapterize(text: str) -> list[ChapterSplit]:
             chapter_num = parts[i]
             chapter_content = parts[i + 1]
 
-            paragraphs = [p.strip() for p in chapter_content.split("\n\n") if p.strip()]
+            paragraphs = _split_paragraphs(chapter_content)
             if not paragraphs:
                 logger.warning(f"Chapter {chapter_num} has no paragraphs, skipping")
                 continue
@@ -273,25 +324,29 @@ def chapterize(text: str) -> list[ChapterSplit]:
     return chapters
 
 
-def llm_detect_chapters(text: str) -> list[ChapterSplit] | None:
-    """Use LLM to intelligently detect chapter boundaries."""
-    if not settings.use_llm_for_structure:
-        return None
+_LLM_DETECT_PREFIX_CHARS = 5000
 
-    try:
-        from ..utils.llm_factory import create_llm_with_fallback
-
-        # Create a simple LLM for chapter detection
-        llm = create_llm_with_fallback(
-            provider="openai",
-            temperature=0.1,
-            timeout=30,
-            max_retries=2,
-            cache_enabled=True,
-        )
 
-        # Simple prompt for chapter detection
-        prompt = f"""
+@functools.lru_cache(maxsize=64)
+def _llm_chapter_outline(prefix: str) -> tuple[tuple[str | None, str], ...]:
+    """Ask the LLM for (title, start_text) of each chapter in a text prefix.
+
+    Memoized on the prefix so retries and re-runs for the same book reuse the
+    previous answer; failures raise and are therefore never cached.
+    """
+    from ..utils.llm_factory import create_llm_with_fallback
+
+    # Create a simple LLM for chapter detection
+    llm = create_llm_with_fallback(
+        provider="openai",
+        temperature=0.1,
+        timeout=30,
+        max_retries=2,
+        cache_enabled=True,
+    )
+
+    # Simple prompt for chapter detection
+    prompt = f"""
         Analyze this literary text and identify chapter boundaries. Return a JSON list of chapter objects with:
         - chapter: number (starting from 1)
         - title: chapter title
@@ -299,44 +354,47 @@ def llm_detect_chapters(text: str) -> list[ChapterSplit] | None:
         - end_text: last few words of the chapter
 
         Text to analyze:
-        {text[:5000]}...
+        {prefix}...
 
         Return only valid JSON, no other text.
         """
 
-        response = llm.invoke(prompt)
-
-        # Try to parse the response
-        import json
+    response = llm.invoke(prompt)
 
-        try:
-            # Strip markdown code blocks before parsing
-            cleaned_content = strip_markdown_code_blocks(response.content)
-            chapters_data = json.loads(cleaned_content)
-            chapters = []
-
-            for i, ch_data in enumerate(chapters_data):
-                chapters.append(
-                    ChapterSplit(
-                        chapter=i + 1,
-                        title=ch_data.get("title", f"Chapter {i + 1}"),
-                        paragraphs=[
-                            f"Chapter content starting with: {ch_data.get('start_text', '')}"
-                        ],
-                    )
-                )
+    # Strip markdown code blocks before parsing
+    cleaned_content = strip_markdown_code_blocks(response.content)
+    chapters_data = orjson.loads(cleaned_content)
+    return tuple(
+        (ch_data.get("title"), ch_data.get("start_text", ""))
+        for ch_data in chapters_data
+    )
 
-            logger.info(f"LLM detected {len(chapters)} chapters")
-            return chapters
 
-        except json.JSONDecodeError:
-            logger.warning("LLM chapter detection returned invalid JSON")
-            return None
+def llm_detect_chapters(text: str) -> list[ChapterSplit] | None:
+    """Use LLM to intelligently detect chapter boundaries."""
+    if not settings.use_llm_for_structure:
+        return None
 
+    try:
+        outline = _llm_chapter_outline(text[:_LLM_DETECT_PREFIX_CHARS])
+        chapters = [
+            ChapterSplit(
+                chapter=i + 1,
+                title=title or f"Chapter {i + 1}",
+                paragraphs=[f"Chapter content starting with: {start_text}"],
+            )
+            for i, (title, start_text) in enumerate(outline)
+        ]
+    except orjson.JSONDecodeError:
+        logger.warning("LLM chapter detection returned invalid JSON")
+        return None
     except Exception as e:
         logger.warning(f"LLM chapter detection failed: {e}")
         return None
 
+    logger.info(f"LLM detected {len(chapters)} chapters")
+    return chapters
+
 
 # LCEL Runnables
 IngestChain = RunnableLambda(lambda x: load_gutendex(x["book_id"]))
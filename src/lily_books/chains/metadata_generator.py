@@ -1,8 +1,10 @@
 """LLM chain for generating publishing metadata."""
 
-import json
+import functools
 import logging
 
+import orjson
+from langchain_core.messages import SystemMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
@@ -11,19 +13,22 @@ from ..config import get_config
 from ..models import ChapterDoc, PublishingMetadata
 from ..observability import ChainTraceCallback
 from ..tools.isbn_generator import generate_isbns_for_book
+from ..utils.cache import get_cached_llm
 from ..utils.fail_fast import fail_fast_on_exception
 
 logger = logging.getLogger(__name__)
 
+# Characters of Chapter 1 sent as sample content
+_SAMPLE_TEXT_CHARS = 2000
+
 # JSON output parser (more reliable than PydanticOutputParser)
 metadata_parser = JsonOutputParser()
 
-# Metadata generation prompt
-METADATA_PROMPT = ChatPromptTemplate.from_messages(
-    [
-        (
-            "system",
-            """You are an expert book marketer and publisher specializing in modernized classic literature.
+# Static instructions shared by every book: persona, JSON skeleton,
+# requirements and the cover_prompt examples. Kept free of template
+# variables so the prefix is byte-identical across calls and can be served
+# from the provider's prompt cache.
+METADATA_SYSTEM = """You are an expert book marketer and publisher specializing in modernized classic literature.
 
 Your task is to create compelling, SEO-optimized metadata for a modernized edition of a public domain classic.
 
@@ -36,7 +41,7 @@ Target audience:
 The modernization preserves the original story, characters, and meaning while updating archaic language to contemporary English suitable for modern readers.
 
 IMPORTANT: Return ONLY a valid JSON object with the following exact structure (no markdown, no wrapping):
-{{
+{
   "title": "string",
   "subtitle": "string or null",
   "author": "string",
@@ -55,25 +60,7 @@ IMPORTANT: Return ONLY a valid JSON object with the following exact structure (n
   "license": "string",
   "cover_style": "modern",
   "cover_prompt": "string"
-}}
-
-Generate professional, compelling metadata that will attract readers while accurately representing the modernized edition.""",
-        ),
-        (
-            "user",
-            """Generate publishing metadata for this book:
-
-Original Title: {original_title}
-Original Author: {original_author}
-Public Domain Source: {source}
-Publisher: {publisher}
-
-Sample Content (first 2000 characters from Chapter 1):
-{sample_text}
-
-Total Chapters: {chapter_count}
-
-IMPORTANT: Use your knowledge of "{original_title}" by {original_author} to inform the cover_prompt. The sample text provides context, but you should draw on the well-known historical setting, themes, and atmosphere of this classic work.
+}
 
 Requirements:
 1. **Title**: Use the original title with "(Modernized Student Edition)" suffix
@@ -103,38 +90,83 @@ Requirements:
 
    Example BAD cover_prompt: "A classic book cover with elegant design" (too generic, no book-specific details)
 
-Focus on educational value, accessibility, and preserving literary merit. Make it compelling and market-ready!""",
-        ),
+Focus on educational value, accessibility, and preserving literary merit. Make it compelling and market-ready!
+
+Generate professional, compelling metadata that will attract readers while accurately representing the modernized edition."""
+
+# Per-book fields only, placed after the cached static prefix
+METADATA_USER = """Generate publishing metadata for this book:
+
+Original Title: {original_title}
+Original Author: {original_author}
+Public Domain Source: {source}
+Publisher: {publisher}
+
+Sample Content (first 2000 characters from Chapter 1):
+{sample_text}
+
+Total Chapters: {chapter_count}
+
+IMPORTANT: Use your knowledge of "{original_title}" by {original_author} to inform the cover_prompt. The sample text provides context, but you should draw on the well-known historical setting, themes, and atmosphere of this classic work."""
+
+# A pre-built SystemMessage is passed through untemplated, so the JSON
+# skeleton needs no brace escaping.
+METADATA_SYSTEM_MESSAGE = SystemMessage(
+    content=[
+        {
+            "type": "text",
+            "text": METADATA_SYSTEM,
+            "cache_control": {"type": "ephemeral"},
+        }
     ]
 )
 
+# Metadata generation prompt
+METADATA_PROMPT = ChatPromptTemplate.from_messages(
+    [METADATA_SYSTEM_MESSAGE, ("user", METADATA_USER)]
+)
 
-# Build chain with retry (lazy initialization)
-def get_metadata_chain():
-    """Get metadata generation chain with lazy initialization."""
-    import os
-
-    from dotenv import load_dotenv
 
-    load_dotenv()
+@functools.lru_cache(maxsize=4)
+def _build_metadata_chain(model: str, api_key: str, max_retries: int):
+    """Build the metadata chain once per model settings.
 
-    config = get_config()
-    logger.info(f"Creating metadata LLM with model: {config.openai_model}")
-    # Use GPT-5-mini if configured
+    Reusing the ChatOpenAI client keeps its HTTP connection pool alive across
+    books instead of reconnecting on every call.
+    """
+    logger.info(f"Creating metadata LLM with model: {model}")
     # Use OpenRouter for all models
     llm = ChatOpenAI(
-        model=config.openai_model,
-        api_key=os.getenv("OPENROUTER_API_KEY"),
+        model=model,
+        api_key=api_key,
         base_url="https://openrouter.ai/api/v1",
         temperature=1.0,
         max_completion_tokens=2000,
-    ).with_retry(
-        stop_after_attempt=config.llm_max_retries, wait_exponential_jitter=True
+    )
+    # Same response cache as the factory-built LLMs: keyed on the rendered
+    # prompt and model params, so re-running a book skips the call and any
+    # prompt edit misses cleanly
+    # JSON mode: the API guarantees a syntactically valid object, so parse
+    # failures no longer burn a retry. The schema stays in the cached
+    # system prompt and the result is validated by PublishingMetadata.
+    llm = (
+        get_cached_llm(llm)
+        .bind(response_format={"type": "json_object"})
+        .with_retry(stop_after_attempt=max_retries, wait_exponential_jitter=True)
     )
 
     return METADATA_PROMPT | llm | metadata_parser
 
 
+# Build chain with retry (lazy initialization)
+def get_metadata_chain():
+    """Get metadata generation chain with lazy initialization."""
+    config = get_config()
+    return _build_metadata_chain(
+        config.openai_model, config.openrouter_api_key, config.llm_max_retries
+    )
+
+
 def generate_metadata(
     original_title: str,
     original_author: str,
@@ -160,9 +192,17 @@ def generate_metadata(
     sample_text = ""
     if chapters and chapters[0].pairs:
         # Take first 15 paragraphs (up to 2000 chars) to give LLM enough context
-        # to understand the book's time period, setting, themes, and characters
-        sample_paragraphs = chapters[0].pairs[:15]
-        sample_text = "\n\n".join([p.modern for p in sample_paragraphs])[:2000]
+        # to understand the book's time period, setting, themes, and characters.
+        # Stop copying once the cap is reached instead of joining then slicing.
+        pieces = []
+        remaining = _SAMPLE_TEXT_CHARS
+        for pair in chapters[0].pairs[:15]:
+            piece = ("\n\n" + pair.modern if pieces else pair.modern)[:remaining]
+            pieces.append(piece)
+            remaining -= len(piece)
+            if remaining <= 0:
+                break
+        sample_text = "".join(pieces)
 
     # Prepare callbacks
     callbacks = []
@@ -192,11 +232,11 @@ def generate_metadata(
             # If we got a string, the LLM may have returned raw JSON
             # Try to fix common JSON errors (semicolons instead of commas)
             try:
-                raw_result = json.loads(raw_result)
-            except json.JSONDecodeError:
+                raw_result = orjson.loads(raw_result)
+            except orjson.JSONDecodeError:
                 # Try to fix semicolon errors
                 fixed_json = raw_result.replace(';"', ',"').replace(";\n", ",\n")
-                raw_result = json.loads(fixed_json)
+                raw_result = orjson.loads(fixed_json)
 
         if isinstance(raw_result, dict):
             # Check if wrapped in properties key
@@ -6,12 +6,19 @@ Generates SEO-optimized metadata for maximum discoverability on:
 - Apple Books (via Draft2Digital)
 """
 
+import functools
+import hashlib
+from collections.abc import Callable
 from typing import Any
 
+import orjson
+from langchain_core.messages import SystemMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 
+from lily_books.config import settings
 from lily_books.models import FlowState, PublishingMetadata, RetailMetadata
+from lily_books.storage import load_retail_metadata, save_retail_metadata
 from lily_books.utils.llm_factory import create_llm_with_fallback
 
 # BISAC category reference
@@ -33,42 +40,12 @@ BISAC_CATEGORIES = {
 }
 
 
-class RetailMetadataGenerator:
-    """Generates AI-optimized metadata for maximum discoverability."""
-
-    def __init__(self):
-        self.llm = create_llm_with_fallback(
-            provider="openai",
-            temperature=0.7,
-        )
-        self.parser = JsonOutputParser(pydantic_object=RetailMetadata)
-
-    def generate_metadata(self, state: FlowState) -> FlowState:
-        """Generate SEO-optimized metadata for retail distribution."""
-
-        # Extract existing metadata
-        pub_meta = state.get("publishing_metadata")
-        if isinstance(pub_meta, PublishingMetadata):
-            pub_meta_dict = pub_meta.model_dump()
-        else:
-            pub_meta_dict = pub_meta or {}
-
-        original_title = pub_meta_dict.get("title", "Untitled")
-        author = pub_meta_dict.get("original_author", "Unknown")
-        modernized_author = pub_meta_dict.get("author", author)
-
-        # Get sample text for context
-        sample_text = self._extract_sample_text(state)
-
-        # Get pricing info if available
-        pricing = state.get("pricing", {})
-        price = pricing.get("base_price_usd", 2.99)
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    """You are an expert book marketing strategist specializing in
+# Static persona, search-intent guidance, requirements and output schema.
+# No template variables, so the system message is byte-identical for every
+# book and can be served from the provider's prompt cache. The schema is
+# written out by hand rather than interpolated from
+# parser.get_format_instructions(); keep it in sync with RetailMetadata.
+RETAIL_SYSTEM = """You are an expert book marketing strategist specializing in
 metadata optimization for Amazon, Google Play, and Apple Books.
 
 Your goal: Maximize discoverability through SEO-rich, compelling metadata
@@ -86,25 +63,6 @@ Emphasize:
 - Student-friendly
 - Clear, contemporary language
 
-Output format: {format_instructions}
-""",
-                ),
-                (
-                    "human",
-                    """Generate metadata for this modernized classic edition:
-
-Original Title: {original_title}
-Author: {author}
-Modernized by: {modernized_author}
-
-Our Edition: "{modern_title}"
-
-Sample modernized text (first paragraph):
-{sample_text}
-
-Target price point: ${price}
-Primary retailers: Amazon KDP, Google Play Books, Apple Books
-
 Research shows readers search for:
 - "[classic title] easy to read"
 - "[classic title] modern English"
@@ -124,25 +82,126 @@ Requirements:
 - bisac_categories: 3-5 BISAC codes (use FIC004000 for Classics)
 - amazon_keywords: 7 keywords specific to Amazon search
 - comp_titles: 5 competitive/comparable titles
-""",
-                ),
-            ]
+
+Output format: return ONLY a JSON object (no markdown, no wrapping) of this shape:
+{
+  "title_variations": ["string", "string", "string"],
+  "subtitle": "string or null",
+  "description_short": "string",
+  "description_long": "string",
+  "keywords": ["string"],
+  "bisac_categories": ["string"],
+  "amazon_keywords": ["string"],
+  "comp_titles": [{"title": "string", "author": "string"}],
+  "age_rating": "string or null",
+  "series_info": null
+}"""
+
+# Per-book fields only, placed after the cached static prefix
+RETAIL_USER = """Generate metadata for this modernized classic edition:
+
+Original Title: {original_title}
+Author: {author}
+Modernized by: {modernized_author}
+
+Our Edition: "{modern_title}"
+
+Sample modernized text (first paragraph):
+{sample_text}
+
+Target price point: ${price}
+Primary retailers: Amazon KDP, Google Play Books, Apple Books"""
+
+# Passed through untemplated, so the JSON schema braces need no escaping
+RETAIL_SYSTEM_MESSAGE = SystemMessage(
+    content=[
+        {
+            "type": "text",
+            "text": RETAIL_SYSTEM,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+)
+
+
+RETAIL_PROMPT = ChatPromptTemplate.from_messages(
+    [RETAIL_SYSTEM_MESSAGE, ("human", RETAIL_USER)]
+)
+
+# Fingerprint of the prompt text; any prompt edit invalidates saved metadata
+RETAIL_PROMPT_VERSION = hashlib.blake2b(
+    f"{RETAIL_SYSTEM}\x1f{RETAIL_USER}".encode(), digest_size=8
+).hexdigest()
+
+
+def _retail_cache_key(inputs: dict[str, Any], model: str) -> str:
+    """Key saved retail metadata on the model, prompt version and prompt inputs."""
+    payload = orjson.dumps(
+        {"model": model, "prompt": RETAIL_PROMPT_VERSION, **inputs},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+class RetailMetadataGenerator:
+    """Generates AI-optimized metadata for maximum discoverability."""
+
+    def __init__(
+        self,
+        llm_factory: Callable = create_llm_with_fallback,
+        model: str | None = None,
+    ):
+        # Model the LLM is built with; saved metadata is attributed to it
+        self.model = model or settings.openai_model
+        self.llm = llm_factory(
+            provider="openai",
+            temperature=0.7,
         )
+        self.parser = JsonOutputParser(pydantic_object=RetailMetadata)
+        self.chain = RETAIL_PROMPT | self.llm | self.parser
+
+    def generate_metadata(self, state: FlowState) -> FlowState:
+        """Generate SEO-optimized metadata for retail distribution."""
 
-        chain = prompt | self.llm | self.parser
+        # Extract existing metadata
+        pub_meta = state.get("publishing_metadata")
+        if isinstance(pub_meta, PublishingMetadata):
+            pub_meta_dict = pub_meta.model_dump()
+        else:
+            pub_meta_dict = pub_meta or {}
+
+        original_title = pub_meta_dict.get("title", "Untitled")
+        author = pub_meta_dict.get("original_author", "Unknown")
+        modernized_author = pub_meta_dict.get("author", author)
+
+        # Get sample text for context
+        sample_text = self._extract_sample_text(state)
+
+        # Get pricing info if available
+        pricing = state.get("pricing", {})
+        price = pricing.get("base_price_usd", 2.99)
+
+        inputs = {
+            "original_title": original_title,
+            "author": author,
+            "modernized_author": modernized_author,
+            "modern_title": original_title,
+            "sample_text": sample_text[:500],
+            "price": price,
+        }
+
+        # Reuse metadata generated for the same inputs on an earlier run
+        slug = state.get("slug")
+        cache_key = _retail_cache_key(inputs, self.model)
+        if slug:
+            cached = load_retail_metadata(slug, cache_key)
+            if cached is not None:
+                state["retail_metadata"] = cached.model_dump()
+                print("\n✓ Reusing saved SEO metadata (inputs unchanged)\n")
+                return state
 
         try:
-            metadata_dict = chain.invoke(
-                {
-                    "format_instructions": self.parser.get_format_instructions(),
-                    "original_title": original_title,
-                    "author": author,
-                    "modernized_author": modernized_author,
-                    "modern_title": original_title,
-                    "sample_text": sample_text[:500],
-                    "price": price,
-                }
-            )
+            metadata_dict = self.chain.invoke(inputs)
 
             # Handle case where metadata might already be a RetailMetadata instance
             if isinstance(metadata_dict, RetailMetadata):
@@ -153,12 +212,20 @@ Requirements:
             # Serialize to dict before storing in state (for LangGraph compatibility)
             state["retail_metadata"] = retail_metadata.model_dump()
 
+            if slug:
+                try:
+                    save_retail_metadata(slug, retail_metadata, cache_key)
+                except OSError as e:
+                    print(f"⚠ Could not save retail metadata: {e}")
+
             print("\n✓ Generated SEO metadata:")
             print(f"  - Title variations: {len(retail_metadata.title_variations)}")
             print(f"  - Keywords: {len(retail_metadata.keywords)}")
             print(f"  - Amazon keywords: {len(retail_metadata.amazon_keywords)}")
             print(f"  - BISAC categories: {len(retail_metadata.bisac_categories)}")
-            print(f"  - Description length: {len(retail_metadata.description_long)} chars")
+            print(
+                f"  - Description length: {len(retail_metadata.description_long)} chars"
+            )
             print(f"  - Comparative titles: {len(retail_metadata.comp_titles)}\n")
 
             return state
@@ -256,9 +323,19 @@ Requirements:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _get_retail_generator(llm_factory: Callable, model: str) -> RetailMetadataGenerator:
+    """Create the generator (and its LLM client) once per process.
+
+    Keyed on the LLM factory and model so patching create_llm_with_fallback
+    or changing settings.openai_model yields a fresh generator.
+    """
+    return RetailMetadataGenerator(llm_factory, model)
+
+
 def generate_retail_metadata_node(state: FlowState) -> dict[str, Any]:
     """LangGraph node for retail metadata generation."""
-    generator = RetailMetadataGenerator()
+    generator = _get_retail_generator(create_llm_with_fallback, settings.openai_model)
     state = generator.generate_metadata(state)
 
     return {"retail_metadata": state["retail_metadata"]}
@@ -1,13 +1,17 @@
 """Writer chain for modernizing text using GPT-4o."""
 
 import asyncio
+import functools
+import inspect
 import logging
 
 # Ensure legacy module path works for older tests (src.lily_books...)
 import sys as _sys
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from langchain_core.output_parsers import PydanticOutputParser
+from pydantic import ValidationError
 
 from .. import observability
 from ..config import settings
@@ -27,6 +31,7 @@ create_observability_callback = observability.create_observability_callback
 create_llm_with_fallback = llm_factory.create_llm_with_fallback
 calculate_optimal_batch_size = tokens.calculate_optimal_batch_size
 log_token_usage = tokens.log_token_usage
+pack_paragraphs_by_tokens = tokens.pack_paragraphs_by_tokens
 validate_context_window = tokens.validate_context_window
 
 import re
@@ -134,47 +139,61 @@ def _build_writer_chain(trace_name: str | None = None):
         writer_chain = patched_chain
         return patched_chain
 
-    kwargs = {
-        "provider": "openai",
-        "temperature": 0.2,
-        "timeout": 30,
-        "max_retries": 2,
-        "cache_enabled": True,
-    }
+    chain = _get_writer_chain(create_llm_with_fallback)
     if trace_name is not None:
-        kwargs["trace_name"] = trace_name
-
-    writer_llm = create_llm_with_fallback(**kwargs)
-
-    # Create a function to strip markdown from LLM output before parsing
-    def clean_llm_output(llm_response):
-        """Strip markdown code blocks from LLM response."""
-        # Get the content from the LLM response
-        content = (
-            llm_response.content
-            if hasattr(llm_response, "content")
-            else str(llm_response)
-        )
-        # Strip markdown and return for parsing
-        return strip_markdown_code_blocks(content)
+        # Per-chapter run name for tracing, without rebuilding the client
+        chain = chain.with_config(run_name=trace_name)
+
+    writer_chain = chain
+    return chain
+
+
+def _clean_llm_output(llm_response):
+    """Strip markdown code blocks from LLM response."""
+    # Get the content from the LLM response
+    content = (
+        llm_response.content if hasattr(llm_response, "content") else str(llm_response)
+    )
+    # Strip markdown and return for parsing
+    return strip_markdown_code_blocks(content)
+
 
-    chain = (
+@functools.lru_cache(maxsize=1)
+def _get_writer_chain(llm_factory: Callable):
+    """Build the writer chain once per process (per LLM factory).
+
+    Reusing the client keeps its connection pool alive across chapters.
+    Keyed on the factory so patching create_llm_with_fallback yields a
+    fresh chain.
+    """
+    writer_llm = llm_factory(
+        provider="openai",
+        temperature=0.2,
+        timeout=30,
+        max_retries=2,
+        cache_enabled=True,
+        trace_name="writer",
+    )
+
+    return (
         {
             "joined": lambda d: d["joined"],
             "format_instructions": lambda d: get_format_instructions_for_model(),
         }
         | writer_prompt
         | writer_llm
-        | clean_llm_output
+        | _clean_llm_output
         | writer_parser
     )
 
-    writer_chain = chain
-    return chain
-
 
+@functools.lru_cache(maxsize=1)
 def get_format_instructions_for_model():
-    """Get format instructions for OpenRouter models."""
+    """Get format instructions for OpenRouter models.
+
+    The WriterOutput schema is fixed, so the rendered string is computed once
+    and reused for every batch (keeping prompt bytes identical across calls).
+    """
     return writer_parser.get_format_instructions()
 
 
@@ -200,7 +219,7 @@ def split_paragraphs(text: str) -> list[str]:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Split on double newlines first
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+    paragraphs = [p for p in map(str.strip, text.split("\n\n")) if p]
 
     # Further split long paragraphs that might contain multiple sentences
     split_paragraphs = []
@@ -226,6 +245,60 @@ def split_paragraphs(text: str) -> list[str]:
     return split_paragraphs
 
 
+def _unique_paragraph_indices(
+    split_paras: list[str],
+) -> tuple[list[int], dict[str, int]]:
+    """Return indices of first occurrences and a text -> first index map.
+
+    Repeated paragraphs (scene breaks, refrains, one-word lines) are only
+    sent to the writer once; see _expand_duplicate_pairs.
+    """
+    first_index: dict[str, int] = {}
+    unique_indices = []
+    for i, para in enumerate(split_paras):
+        if para not in first_index:
+            first_index[para] = i
+            unique_indices.append(i)
+    return unique_indices, first_index
+
+
+def _expand_duplicate_pairs(
+    pairs: list[ParaPair],
+    split_paras: list[str],
+    first_index: dict[str, int],
+    chapter: int,
+) -> list[ParaPair]:
+    """Copy rewritten first occurrences onto their duplicates, in paragraph order."""
+    if len(first_index) == len(split_paras):
+        return pairs
+
+    by_index = {pair.i: pair for pair in pairs}
+
+    expanded = []
+    for i, para in enumerate(split_paras):
+        pair = by_index.get(first_index[para])
+        if pair is None:
+            continue
+        if pair.i != i:
+            pair = pair.model_copy(
+                update={"i": i, "para_id": f"ch{chapter:02d}_para{i:03d}"}
+            )
+        expanded.append(pair)
+    return expanded
+
+
+async def _ainvoke_writer(writer_chain, input_data: dict, config: dict):
+    """Invoke the writer chain, natively async when the chain supports it."""
+    if inspect.iscoroutinefunction(getattr(writer_chain, "ainvoke", None)):
+        return await writer_chain.ainvoke(input_data, config=config)
+
+    # Patched/sync-only chains run in a worker thread to avoid blocking
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(writer_chain.invoke, input_data, config=config)
+    )
+
+
 @debug_async_function
 async def rewrite_chapter_async(
     ch: ChapterSplit, slug: str = None, progress_callback: Callable | None = None
@@ -249,17 +322,35 @@ async def rewrite_chapter_async(
         model=settings.openai_model,
         target_utilization=0.2,  # Further reduced to 0.2 for smaller batches
         min_batch_size=1,
-        max_batch_size=3,  # Reduced to 3 for fastest API responses
+        max_batch_size=settings.writer_max_batch_size,
     )
 
+    # Only the first occurrence of a repeated paragraph is rewritten
+    unique_indices, first_index = _unique_paragraph_indices(split_paras)
+
+    # Pack up to batch_size paragraphs per call, flushing early once the
+    # token budget is reached so long paragraphs don't stall a whole batch
+    batch_ends = {
+        unique_indices[indices[-1]]
+        for indices in pack_paragraphs_by_tokens(
+            [split_paras[i] for i in unique_indices],
+            model=settings.openai_model,
+            max_tokens=settings.writer_batch_max_tokens,
+            max_batch_size=batch_size,
+        )
+    }
+
     logger.info(
-        f"Chapter {ch.chapter}: {len(split_paras)} paragraphs, batch_size={batch_size}"
+        f"Chapter {ch.chapter}: {len(split_paras)} paragraphs, "
+        f"batch_size={batch_size}, batches={len(batch_ends)}"
     )
 
     writer_chain = _build_writer_chain(
-        trace_name=f"writer_async_ch{ch.chapter}_{slug}"
-        if slug
-        else f"writer_async_ch{ch.chapter}"
+        trace_name=(
+            f"writer_async_ch{ch.chapter}_{slug}"
+            if slug
+            else f"writer_async_ch{ch.chapter}"
+        )
     )
 
     # Retry handled by manual retry loop in process_batch functions
@@ -278,12 +369,13 @@ async def rewrite_chapter_async(
     update_activity("rewrite_chapter_async batch setup")
 
     tasks = []
-    for i, para in enumerate(split_paras):
+    for i in unique_indices:
+        para = split_paras[i]
         batch.append(f"PARA {i} [TYPE={detect_type(para)}]: {para}")
         batch_indices.append(i)
 
         # Process batch when full or at end
-        if len(batch) == batch_size or i == len(split_paras) - 1:
+        if i in batch_ends:
             log_step(
                 "rewrite_chapter_async.batch_ready",
                 batch_number=len(tasks),
@@ -335,6 +427,7 @@ async def rewrite_chapter_async(
             continue
         pairs.extend(result)
 
+    pairs = _expand_duplicate_pairs(pairs, split_paras, first_index, ch.chapter)
     return ChapterDoc(chapter=ch.chapter, title=ch.title, pairs=pairs)
 
 
@@ -362,12 +455,8 @@ async def process_batch_async(
             logger.info(
                 f"Async batch processing attempt {attempt} for chapter {ch.chapter}"
             )
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
             # Use LangChain chain via OpenRouter
-            raw_output = await loop.run_in_executor(
-                None, lambda: writer_chain.invoke({"joined": joined}, config=config)
-            )
+            raw_output = await _ainvoke_writer(writer_chain, {"joined": joined}, config)
 
             # Parse and validate output
             parsed_output = safe_parse_writer_output(raw_output)
@@ -425,6 +514,26 @@ async def process_batch_async(
                 # Final attempt failed or max attempts reached
                 logger.error(f"Batch processing failed after {attempt} attempts: {e}")
 
+                # Isolate the bad input: retry each paragraph on its own so
+                # one unparseable paragraph doesn't discard the whole batch.
+                # Only for parse/validation failures; transport errors would
+                # just fail again once per paragraph. Sequential, so the
+                # split stays within the batch's own concurrency slot.
+                if len(batch) > 1 and isinstance(e, (ValueError, ValidationError)):
+                    pairs = []
+                    for single_para, orig_idx in zip(batch, batch_indices):
+                        pairs.extend(
+                            await process_single_paragraph_async(
+                                single_para,
+                                [orig_idx],
+                                ch,
+                                writer_chain,
+                                config,
+                                split_paras,
+                            )
+                        )
+                    return pairs
+
                 # Create pairs with original text and error note
                 pairs = []
                 for j, orig_idx in enumerate(batch_indices):
@@ -455,11 +564,9 @@ async def process_single_paragraph_async(
     # Retry with enhancement on failure
     for attempt in range(1, settings.max_retry_attempts + 1):
         try:
-            loop = asyncio.get_event_loop()
             # Use LangChain chain via OpenRouter
-            raw_output = await loop.run_in_executor(
-                None,
-                lambda: writer_chain.invoke({"joined": single_para}, config=config),
+            raw_output = await _ainvoke_writer(
+                writer_chain, {"joined": single_para}, config
             )
 
             # Parse and validate output
@@ -624,6 +731,25 @@ def process_batch_sync(
                 # Final attempt failed or max attempts reached
                 logger.error(f"Batch processing failed after {attempt} attempts: {e}")
 
+                # Isolate the bad input: retry each paragraph on its own so
+                # one unparseable paragraph doesn't discard the whole batch.
+                # Only for parse/validation failures; transport errors would
+                # just fail again once per paragraph.
+                if len(batch) > 1 and isinstance(e, (ValueError, ValidationError)):
+                    pairs = []
+                    for single_para, orig_idx in zip(batch, batch_indices):
+                        pairs.extend(
+                            process_single_paragraph_sync(
+                                single_para,
+                                [orig_idx],
+                                ch,
+                                writer_chain,
+                                config,
+                                split_paras,
+                            )
+                        )
+                    return pairs
+
                 # Create pairs with original text and error note
                 pairs = []
                 for j, orig_idx in enumerate(batch_indices):
@@ -756,17 +882,35 @@ def rewrite_chapter(ch: ChapterSplit, slug: str = None) -> ChapterDoc:
         model=settings.openai_model,
         target_utilization=0.2,  # Further reduced to 0.2 for smaller batches
         min_batch_size=1,
-        max_batch_size=3,  # Reduced to 3 for fastest API responses
+        max_batch_size=settings.writer_max_batch_size,
     )
 
+    # Only the first occurrence of a repeated paragraph is rewritten
+    unique_indices, first_index = _unique_paragraph_indices(split_paras)
+
+    # Pack up to batch_size paragraphs per call, flushing early once the
+    # token budget is reached so long paragraphs don't stall a whole batch
+    batch_ends = {
+        unique_indices[indices[-1]]
+        for indices in pack_paragraphs_by_tokens(
+            [split_paras[i] for i in unique_indices],
+            model=settings.openai_model,
+            max_tokens=settings.writer_batch_max_tokens,
+            max_batch_size=batch_size,
+        )
+    }
+
     logger.info(
-        f"Chapter {ch.chapter}: {len(split_paras)} paragraphs, batch_size={batch_size}"
+        f"Chapter {ch.chapter}: {len(split_paras)} paragraphs, "
+        f"batch_size={batch_size}, batches={len(batch_ends)}"
     )
 
     writer_chain = _build_writer_chain(
-        trace_name=f"writer_sync_ch{ch.chapter}_{slug}"
-        if slug
-        else f"writer_sync_ch{ch.chapter}"
+        trace_name=(
+            f"writer_sync_ch{ch.chapter}_{slug}"
+            if slug
+            else f"writer_sync_ch{ch.chapter}"
+        )
     )
 
     # Retry handled by manual retry loop in process_batch functions
@@ -776,12 +920,17 @@ def rewrite_chapter(ch: ChapterSplit, slug: str = None) -> ChapterDoc:
     callbacks = create_observability_callback(slug) if slug else []
     config = {"callbacks": callbacks} if callbacks else {}
 
-    for i, para in enumerate(split_paras):
+    # Pass 1: group paragraphs into batches. Each job is a zero-argument
+    # call into the per-batch retry helpers, which already fall back to the
+    # original text on failure.
+    jobs = []
+    for i in unique_indices:
+        para = split_paras[i]
         batch.append(f"PARA {i} [TYPE={detect_type(para)}]: {para}")
         batch_indices.append(i)
 
-        # Process batch when full or at end
-        if len(batch) == batch_size or i == len(split_paras) - 1:
+        # Queue batch when full or at end
+        if i in batch_ends:
             joined = "\n\n".join(batch)
 
             # Validate context window before processing
@@ -792,29 +941,47 @@ def rewrite_chapter(ch: ChapterSplit, slug: str = None) -> ChapterDoc:
             if not is_valid:
                 # Process smaller batches with retry
                 for single_para, orig_idx in zip(batch, batch_indices):
-                    batch_pairs = process_single_paragraph_sync(
-                        single_para, [orig_idx], ch, writer_chain, config, split_paras
+                    jobs.append(
+                        functools.partial(
+                            process_single_paragraph_sync,
+                            single_para,
+                            [orig_idx],
+                            ch,
+                            writer_chain,
+                            config,
+                            split_paras,
+                        )
                     )
-                    pairs.extend(batch_pairs)
-
-                # Reset batch and continue
-                batch = []
-                batch_indices = []
-                continue
-
-            # Log token usage
-            log_token_usage(
-                joined, settings.openai_model, f"rewrite_chapter_{ch.chapter}"
-            )
+            else:
+                # Log token usage
+                log_token_usage(
+                    joined, settings.openai_model, f"rewrite_chapter_{ch.chapter}"
+                )
 
-            # Process batch with retry
-            batch_pairs = process_batch_sync(
-                batch, batch_indices, ch, writer_chain, config, split_paras
-            )
-            pairs.extend(batch_pairs)
+                jobs.append(
+                    functools.partial(
+                        process_batch_sync,
+                        batch,
+                        batch_indices,
+                        ch,
+                        writer_chain,
+                        config,
+                        split_paras,
+                    )
+                )
 
             # Reset batch
             batch = []
             batch_indices = []
 
+    # Pass 2: overlap the LLM round-trips. map() yields results in job order,
+    # so pairs come back in paragraph order regardless of completion order.
+    max_workers = max(1, min(settings.writer_max_concurrency, len(jobs)))
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="writer"
+    ) as executor:
+        for batch_pairs in executor.map(lambda job: job(), jobs):
+            pairs.extend(batch_pairs)
+
+    pairs = _expand_duplicate_pairs(pairs, split_paras, first_index, ch.chapter)
     return ChapterDoc(chapter=ch.chapter, title=ch.title, pairs=pairs)
@@ -67,6 +67,14 @@ class Settings(BaseSettings):
     chapter_processing_timeout: int = 300  # 5 minutes per chapter
     qa_processing_timeout: int = 180  # 3 minutes per QA check
 
+    # Concurrency settings
+    qa_max_concurrency: int = 8  # Max in-flight checker LLM calls per event loop
+    qa_batch_size: int = 1  # Pairs per checker LLM call (1 = one call per pair)
+    writer_max_concurrency: int = 4  # Parallel writer batches per chapter (sync path)
+    writer_max_batch_size: int = 3  # Max paragraphs packed into one writer call
+    writer_batch_max_tokens: int = 3000  # Input token budget per writer call
+    chapter_max_concurrency: int = 3  # Chapters rewritten at once (async path)
+
     # LLM-driven validation settings
     llm_validation_mode: str = "trust"  # "strict", "hybrid", "trust"
     self_healing_enabled: bool = True
@@ -91,8 +99,11 @@ class Settings(BaseSettings):
     # Caching settings
     cache_enabled: bool = True
     cache_ttl_seconds: int = 3600  # 1 hour
-    cache_type: str = "memory"  # "memory" or "redis"
+    cache_type: str = "memory"  # "memory", "redis" or "sqlite"
     redis_url: str = "redis://localhost:6379"
+    cache_sqlite_path: str = ".cache/llm_cache.db"  # Used when cache_type="sqlite"
+    gutendex_cache_dir: str = ".cache/gutendex"  # Downloaded book texts ("" disables)
+    gutendex_max_text_chars: int = 50_000_000  # Abort downloads beyond this size
 
     # Langfuse observability settings
     langfuse_enabled: bool = True
@@ -112,6 +123,9 @@ class Settings(BaseSettings):
     enable_human_review: bool = True  # Require human approval before upload
     epubcheck_path: str = "epubcheck"  # Path to epubcheck executable
 
+    # API server settings
+    cors_origins: list[str] = ["*"]  # Explicit origins recommended for production
+
     # Pipeline feature toggles
     enable_qa_review: bool = True  # Enable/disable QA text validation
     enable_audio: bool = False  # Enable/disable audio generation
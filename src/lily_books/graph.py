@@ -202,8 +202,8 @@ async def rewrite_node_async(
             )
             update_activity("rewrite_node_async parallel processing start")
 
-            # Use semaphore to limit concurrent OpenRouter API calls (max 3 concurrent)
-            semaphore = asyncio.Semaphore(3)
+            # Use semaphore to limit concurrent OpenRouter API calls
+            semaphore = asyncio.Semaphore(max(1, get_config().chapter_max_concurrency))
 
             async def rate_limited_chapter(task, chapter_num, index):
                 async with semaphore:
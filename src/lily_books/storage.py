@@ -7,7 +7,14 @@ from pathlib import Path
 from typing import Any
 
 from .config import ensure_directories, get_project_paths
-from .models import BookMetadata, ChapterDoc, CoverDesign, FlowState, PublishingMetadata
+from .models import (
+    BookMetadata,
+    ChapterDoc,
+    CoverDesign,
+    FlowState,
+    PublishingMetadata,
+    RetailMetadata,
+)
 
 
 @dataclass
@@ -63,6 +70,15 @@ def load_chapter_doc(slug: str, chapter_num: int) -> ChapterDoc | None:
         return None
 
 
+def get_chapter_doc_version(slug: str, chapter_num: int) -> int | None:
+    """Return the chapter JSON file's mtime in ns, or None if it doesn't exist."""
+    paths = get_project_paths(slug)
+    try:
+        return (paths["rewrite"] / f"ch{chapter_num:02d}.json").stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def save_state(slug: str, state: FlowState) -> Path:
     """Save FlowState to JSON file."""
     paths = get_project_paths(slug)
@@ -91,6 +107,15 @@ def load_state(slug: str) -> FlowState | None:
         return None
 
 
+def get_state_version(slug: str) -> int | None:
+    """Return the state JSON file's mtime in ns, or None if it doesn't exist."""
+    paths = get_project_paths(slug)
+    try:
+        return (paths["meta"] / "ingestion_state.json").stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def append_log_entry(slug: str, entry: dict[str, Any]) -> Path:
     """Append log entry to ingestion_log.jsonl."""
     paths = get_project_paths(slug)
@@ -322,3 +347,39 @@ def save_cover_design(slug: str, cover: CoverDesign) -> Path:
         json.dump(cover.model_dump(), f, indent=2, ensure_ascii=False)
 
     return file_path
+
+
+def save_retail_metadata(slug: str, metadata: RetailMetadata, cache_key: str) -> Path:
+    """Save generated retail metadata with the key of the inputs it came from."""
+    paths = get_project_paths(slug)
+    ensure_directories(slug)
+    file_path = paths["meta"] / "retail.json"
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"cache_key": cache_key, "metadata": metadata.model_dump()},
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
+
+    return file_path
+
+
+def load_retail_metadata(slug: str, cache_key: str) -> RetailMetadata | None:
+    """Load saved retail metadata if it was generated from the same inputs."""
+    paths = get_project_paths(slug)
+    input_file = paths["meta"] / "retail.json"
+
+    if not input_file.exists():
+        return None
+
+    try:
+        with open(input_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("cache_key") != cache_key:
+            return None
+        return RetailMetadata(**data["metadata"])
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        print(f"Error loading retail metadata: {e}")
+        return None
@@ -3,16 +3,26 @@
 import hashlib
 import logging
 import sys as _sys
+from pathlib import Path
 from typing import Any
 
 _sys.modules.setdefault("src.lily_books.utils.cache", _sys.modules[__name__])
 
 try:
-    from langchain_community.cache import InMemoryCache, RedisSemanticCache
+    from langchain_community.cache import (
+        InMemoryCache,
+        RedisSemanticCache,
+        SQLiteCache,
+    )
     from langchain_core.caches import BaseCache
 except ImportError:
     # Fallback for older versions
-    from langchain.cache import BaseCache, InMemoryCache, RedisSemanticCache
+    from langchain.cache import (
+        BaseCache,
+        InMemoryCache,
+        RedisSemanticCache,
+        SQLiteCache,
+    )
 
 from ..config import settings
 
@@ -38,6 +48,13 @@ class SemanticCache:
                     redis_url=settings.redis_url, ttl=settings.cache_ttl_seconds
                 )
                 logger.info(f"Redis cache initialized: {settings.redis_url}")
+            elif settings.cache_type == "sqlite":
+                # Persists across runs; keys include the full serialized prompt
+                # and model params, so prompt or schema edits miss cleanly
+                db_path = Path(settings.cache_sqlite_path)
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                self.cache = SQLiteCache(database_path=str(db_path))
+                logger.info(f"SQLite cache initialized: {db_path}")
             else:
                 self.cache = InMemoryCache()
                 logger.info("In-memory cache initialized")
@@ -135,6 +135,48 @@ def calculate_optimal_batch_size(
     return batch_size
 
 
+def pack_paragraphs_by_tokens(
+    paragraphs: list[str],
+    model: str = "openai/gpt-5-mini",
+    max_tokens: int = 3000,
+    max_batch_size: int = 3,
+) -> list[list[int]]:
+    """
+    Greedily pack consecutive paragraphs into batches under a token budget.
+
+    Args:
+        paragraphs: List of paragraphs to process
+        model: Model name
+        max_tokens: Input token budget per batch (including separators)
+        max_batch_size: Maximum paragraphs per batch
+
+    Returns:
+        Lists of paragraph indices, one per batch, in original order. A
+        paragraph larger than the budget is placed in a batch of its own.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    for i, token_count in enumerate(count_tokens_batch(paragraphs, model)):
+        # Estimate 2 tokens per paragraph separator
+        cost = token_count + (2 if current else 0)
+        if current and (
+            len(current) >= max_batch_size or current_tokens + cost > max_tokens
+        ):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+            cost = token_count
+        current.append(i)
+        current_tokens += cost
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
 def estimate_prompt_tokens(
     prompt_template: str, model: str = "openai/gpt-5-mini"
 ) -> int:
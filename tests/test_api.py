@@ -0,0 +1,138 @@
+"""Tests for the FastAPI application."""
+
+from fastapi.testclient import TestClient
+
+from lily_books.api.main import app
+
+ORIGIN = "https://review.example.com"
+
+
+def test_cors_preflight_allows_conditional_requests():
+    """Test preflight accepts If-None-Match and keeps credentialed access."""
+    client = TestClient(app)
+
+    response = client.options(
+        "/api/health",
+        headers={
+            "Origin": ORIGIN,
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "if-none-match",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+
+def test_chapter_pairs_etag_round_trip():
+    """Test a cross-origin client can read the ETag and get a 304 back."""
+    from unittest.mock import patch
+
+    from lily_books.api import main
+    from lily_books.models import ChapterDoc, ParaPair
+
+    chapter_doc = ChapterDoc(
+        chapter=1,
+        title="Chapter 1",
+        pairs=[ParaPair(i=0, para_id="ch01_para000", orig="Orig", modern="Modern")],
+    )
+    main._CHAPTER_CACHE.clear()
+    client = TestClient(app)
+    url = "/api/projects/etag-book/chapters/1/pairs"
+
+    with (
+        patch("lily_books.storage.get_chapter_doc_version", return_value=123),
+        patch("lily_books.storage.load_chapter_doc", return_value=chapter_doc),
+    ):
+        first = client.get(url, headers={"Origin": ORIGIN})
+        assert first.status_code == 200
+        assert first.json()["pairs"][0]["modern"] == "Modern"
+        etag = first.headers["etag"]
+        assert "etag" in first.headers["access-control-expose-headers"].lower()
+
+        second = client.get(url, headers={"Origin": ORIGIN, "If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert not second.content
+
+    main._CHAPTER_CACHE.clear()
+
+
+def test_read_cache_is_lru_bounded():
+    """Test the chapter cache evicts least recently used entries."""
+    import asyncio
+    from unittest.mock import patch
+
+    from lily_books.api import main
+
+    main._CHAPTER_CACHE.clear()
+    with (
+        patch.object(main, "_CHAPTER_CACHE_MAX_ENTRIES", 2),
+        patch("lily_books.storage.get_chapter_doc_version", return_value=1),
+        patch("lily_books.storage.load_chapter_doc", return_value={"chapter": 0}),
+    ):
+        for chapter_num in (1, 2, 1, 3):
+            asyncio.run(main._cached_chapter("book", chapter_num))
+
+    assert list(main._CHAPTER_CACHE) == [("book", 1), ("book", 3)]
+    main._CHAPTER_CACHE.clear()
+
+
+def test_edit_locks_are_released():
+    """Test per-chapter edit locks don't outlive the edits using them."""
+    import asyncio
+    import gc
+
+    from lily_books.api import main
+
+    async def edit():
+        async with main._EDIT_LOCKS.setdefault(("book", 1), asyncio.Lock()):
+            assert ("book", 1) in main._EDIT_LOCKS
+
+    asyncio.run(edit())
+    gc.collect()
+    assert ("book", 1) not in main._EDIT_LOCKS
+
+
+def test_qa_summary_aggregates_chapters():
+    """Test the QA summary reads chapters through the shared cache."""
+    from unittest.mock import patch
+
+    from lily_books.api import main
+    from lily_books.models import ChapterDoc, ParaPair, QAReport
+
+    def load_chapter_doc(slug, chapter_num):
+        qa = QAReport(
+            fidelity_score=90 + chapter_num,
+            readability_grade=8.0,
+            modernization_complete=chapter_num == 1,
+            formatting_preserved=True,
+        )
+        pair = ParaPair(i=0, para_id="p0", orig="Orig", modern="Modern", qa=qa)
+        return ChapterDoc(chapter=chapter_num, title="Chapter", pairs=[pair])
+
+    main._STATE_CACHE.clear()
+    main._CHAPTER_CACHE.clear()
+    client = TestClient(app)
+
+    with (
+        patch("lily_books.storage.get_state_version", return_value=1),
+        patch(
+            "lily_books.storage.load_state",
+            return_value={"rewritten": [{"chapter": 1}, {"chapter": 2}]},
+        ),
+        patch("lily_books.storage.get_chapter_doc_version", return_value=1),
+        patch("lily_books.storage.load_chapter_doc", side_effect=load_chapter_doc),
+    ):
+        response = client.get("/api/projects/summary-book/qa/summary")
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["total_chapters"] == 2
+    assert summary["passed_chapters"] == 1
+    assert summary["fidelity_scores"] == [91, 92]
+    assert set(main._CHAPTER_CACHE) == {("summary-book", 1), ("summary-book", 2)}
+
+    main._STATE_CACHE.clear()
+    main._CHAPTER_CACHE.clear()
@@ -80,8 +80,8 @@ def test_compute_observability_metrics_emphasis_mismatch():
     assert result["emphasis_count_modern"] == 0  # No emphasis in modern
 
 
-@patch("src.lily_books.chains.ingest.requests.get")
-def test_load_gutendex(mock_get):
+@patch("lily_books.chains.ingest._SESSION.get")
+def test_load_gutendex(mock_get, tmp_path):
     """Test Gutendex loading with mocked response."""
     # Mock the metadata response
     mock_metadata = MagicMock()
@@ -91,15 +91,20 @@ def test_load_gutendex(mock_get):
 
     # Mock the text response
     mock_text = MagicMock()
-    mock_text.text = "Sample book text content"
+    mock_text.iter_content.return_value = ["Sample book ", "text content"]
     mock_text.raise_for_status.return_value = None
 
     mock_get.side_effect = [mock_metadata, mock_text]
 
-    result = load_gutendex(123)
+    with patch("lily_books.chains.ingest.settings.gutendex_cache_dir", str(tmp_path)):
+        result = load_gutendex(123)
 
-    assert result == "Sample book text content"
-    assert mock_get.call_count == 2
+        assert result == "Sample book text content"
+        assert mock_get.call_count == 2
+
+        # Second load is served from the local copy without any requests
+        assert load_gutendex(123) == "Sample book text content"
+        assert mock_get.call_count == 2
 
 
 @patch("src.lily_books.chains.writer.create_llm_with_fallback")
@@ -135,6 +140,29 @@ def test_rewrite_chapter(mock_llm_factory):
         ]
 
 
+def test_duplicate_paragraphs_rewritten_once():
+    """Test repeated paragraphs reuse the first occurrence's rewrite."""
+    from lily_books.chains.writer import (
+        _expand_duplicate_pairs,
+        _unique_paragraph_indices,
+    )
+    from lily_books.models import ParaPair
+
+    paras = ["* * *", "It was late.", "* * *"]
+    unique_indices, first_index = _unique_paragraph_indices(paras)
+    assert unique_indices == [0, 1]
+
+    pairs = [
+        ParaPair(i=0, para_id="ch01_para000", orig="* * *", modern="* * *"),
+        ParaPair(i=1, para_id="ch01_para001", orig=paras[1], modern="It got late."),
+    ]
+    expanded = _expand_duplicate_pairs(pairs, paras, first_index, 1)
+
+    assert [p.i for p in expanded] == [0, 1, 2]
+    assert expanded[2].para_id == "ch01_para002"
+    assert expanded[2].modern == "* * *"
+
+
 @patch("src.lily_books.chains.checker.create_llm_with_fallback")
 def test_qa_chapter(mock_llm_factory):
     """Test chapter QA with mocked LLM."""
@@ -186,6 +214,50 @@ def test_qa_chapter_error_handling():
     assert isinstance(updated_doc, type(chapter_doc))
 
 
+def test_checker_result_cache():
+    """Test exact-match checker result cache with LRU eviction."""
+    from lily_books.chains.checker import CheckerResultCache
+    from lily_books.models import CheckerOutput
+
+    cache = CheckerResultCache(max_entries=2)
+    cache.put("orig 1", "modern 1", CheckerOutput(fidelity_score=91))
+    cache.put("orig 2", "modern 2", CheckerOutput(fidelity_score=88))
+
+    assert cache.get("orig 1", "modern 1").fidelity_score == 91
+    assert cache.get("orig 1", "modern 2") is None
+
+    # "orig 2" is now least recently used and gets evicted
+    cache.put("orig 3", "modern 3", CheckerOutput(fidelity_score=95))
+    assert cache.get("orig 2", "modern 2") is None
+    assert cache.get("orig 1", "modern 1") is not None
+
+    # Verdicts from a different checker model are not reused
+    with patch("lily_books.chains.checker.settings.anthropic_model", "other/model"):
+        assert cache.get("orig 1", "modern 1") is None
+
+
+def test_checker_batch_output_parsing():
+    """Test batched checker responses are split back into per-pair results."""
+    import pytest
+
+    from lily_books.chains.checker import _parse_checker_batch_output
+
+    response = MagicMock()
+    response.content = (
+        "```json\n"
+        '{"results": [{"fidelity_score": 92}, {"fidelity_score": 78}]}\n'
+        "```"
+    )
+    response.usage_metadata = None
+
+    results = _parse_checker_batch_output(response)
+    assert [r["fidelity_score"] for r in results] == [92, 78]
+
+    response.content = '{"fidelity_score": 92}'
+    with pytest.raises(ValueError):
+        _parse_checker_batch_output(response)
+
+
 def test_structured_outputs():
     """Test that chains use structured outputs."""
     from lily_books.models import CheckerOutput, ModernizedParagraph, WriterOutput
@@ -293,3 +365,88 @@ def test_soft_validation_approach():
     assert output.fidelity_score == 75
     assert output.confidence == 0.7
     assert output.readability_grade is None  # LLM didn't provide this
+
+
+def test_retail_generator_keyed_on_model():
+    """Test retail metadata is cached per model and keyed on the generator's model."""
+    from unittest.mock import MagicMock
+
+    from lily_books.chains.retail_metadata import (
+        _get_retail_generator,
+        _retail_cache_key,
+    )
+
+    factory = MagicMock()
+    first = _get_retail_generator(factory, "model-a")
+    assert _get_retail_generator(factory, "model-a") is first
+
+    second = _get_retail_generator(factory, "model-b")
+    assert second is not first
+    assert (first.model, second.model) == ("model-a", "model-b")
+
+    inputs = {"original_title": "Title", "author": "Author"}
+    assert _retail_cache_key(inputs, first.model) != _retail_cache_key(
+        inputs, second.model
+    )
+    _get_retail_generator.cache_clear()
+
+
+def test_detected_archaic_one_entry_per_pattern():
+    """Test detected_archaic lists each matching pattern once."""
+    modern = "To-day, said he. Upon my word, said she. To-day again."
+
+    metrics = compute_observability_metrics("Original.", modern)
+
+    assert metrics["detected_archaic"] == [
+        r"\bto-day\b",
+        r"\bupon my word\b",
+        r"\bsaid (he|she)\b",
+    ]
+    assert (
+        compute_observability_metrics("Orig.", "Plain text.")["detected_archaic"] == []
+    )
+
+
+def test_checker_prefix_clears_cache_minimum():
+    """Test the static checker prefix is long enough to be prompt-cached."""
+    from lily_books.chains.checker import (
+        _CHECKER_PREFIX,
+        _MIN_CACHEABLE_PREFIX_BYTES,
+    )
+
+    assert len(_CHECKER_PREFIX.encode("utf-8")) >= _MIN_CACHEABLE_PREFIX_BYTES
+
+
+def test_writer_batch_split_only_on_parse_failure():
+    """Test failed batches are split per paragraph only for parse failures."""
+    from lily_books.chains.writer import process_batch_sync
+    from lily_books.config import settings
+    from lily_books.models import ChapterSplit
+
+    paras = ["First paragraph.", "Second paragraph."]
+    ch = ChapterSplit(chapter=1, title="Chapter 1", paragraphs=paras)
+
+    def invoke(inputs, config=None):
+        # Batches come back unparseable; single paragraphs succeed
+        if "\n\n" in inputs["joined"]:
+            return "not json"
+        return {"paragraphs": [{"modern": f"Modern {inputs['joined']}"}]}
+
+    parse_chain = MagicMock()
+    parse_chain.invoke.side_effect = invoke
+    pairs = process_batch_sync(paras, [0, 1], ch, parse_chain, {}, paras)
+    assert [p.modern for p in pairs] == [f"Modern {p}" for p in paras]
+
+    outage_chain = MagicMock()
+    outage_chain.invoke.side_effect = ConnectionError("upstream unavailable")
+    pairs = process_batch_sync(paras, [0, 1], ch, outage_chain, {}, paras)
+    assert [p.modern for p in pairs] == paras
+    assert outage_chain.invoke.call_count == settings.max_retry_attempts
+
+
+def test_gutendex_session_retries_both_schemes():
+    """Test plain-http text mirrors get the same retrying adapter as https."""
+    from lily_books.chains.ingest import _SESSION
+
+    for url in ("https://gutendex.com/books/1/", "http://www.gutenberg.org/1.txt"):
+        assert _SESSION.get_adapter(url).max_retries.total == 3
@@ -370,3 +370,27 @@ def test_mixed_severity_issues():
 
     assert passed  # No critical issues
     assert len(issues) == 2  # Both issues tracked
+
+
+def test_fidelity_stats_reported():
+    """Test that fidelity stats are filled in even when a gate fails."""
+    pairs = [
+        ParaPair(
+            i=idx,
+            para_id=f"p{idx}",
+            orig="Original text",
+            modern="Modern text",
+            qa=QAReport(fidelity_score=score, readability_grade=8.0),
+        )
+        for idx, score in enumerate([95, 80, 90])
+    ]
+
+    quality_settings = {"min_fidelity": 85, "readability_range": (5.0, 12.0)}
+    stats = {}
+    passed, reason, issues = evaluate_chapter_quality(
+        pairs, [], quality_settings, stats=stats
+    )
+
+    assert not passed
+    assert stats["min_fidelity"] == 80
+    assert stats["mean_fidelity"] == 265 / 3
@@ -22,6 +22,7 @@ from lily_books.utils.tokens import (
     count_tokens,
     count_tokens_batch,
     get_context_window,
+    pack_paragraphs_by_tokens,
     validate_context_window,
 )
 
@@ -106,6 +107,22 @@ class TestTokenCounting:
         batch_size = calculate_optimal_batch_size([], "gpt-4o")
         assert batch_size == 1  # min_batch_size
 
+    def test_pack_paragraphs_by_tokens(self):
+        """Test token-budget packing keeps order and isolates long paragraphs."""
+        paragraphs = ["Short para"] * 5
+        batches = pack_paragraphs_by_tokens(
+            paragraphs, "gpt-4o", max_tokens=3000, max_batch_size=2
+        )
+        assert batches == [[0, 1], [2, 3], [4]]
+
+        paragraphs = ["Short para", "word " * 500, "Short para"]
+        batches = pack_paragraphs_by_tokens(
+            paragraphs, "gpt-4o", max_tokens=100, max_batch_size=8
+        )
+        assert batches == [[0], [1], [2]]
+
+        assert pack_paragraphs_by_tokens([], "gpt-4o") == []
+
 
 class TestValidators:
     """Test validation utilities."""
@@ -297,6 +314,17 @@ class TestCaching:
         cache = SemanticCache()
         assert cache.cache is None
 
+    @patch("src.lily_books.utils.cache.settings")
+    def test_semantic_cache_sqlite(self, mock_settings, tmp_path):
+        """Test SemanticCache with the persistent SQLite backend."""
+        mock_settings.cache_enabled = True
+        mock_settings.cache_type = "sqlite"
+        mock_settings.cache_sqlite_path = str(tmp_path / "cache" / "llm.db")
+
+        cache = SemanticCache()
+        assert type(cache.cache).__name__ == "SQLiteCache"
+        assert (tmp_path / "cache").is_dir()
+
     def test_get_cache_key(self):
         """Test cache key generation."""
         cache = SemanticCache()